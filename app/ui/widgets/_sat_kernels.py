@@ -0,0 +1,107 @@
+"""Numeric kernels for the satellite tracker
+
+Compiled with Numba when it is installed (the compiled code is cached on
+disk, so the compile cost is only paid on the first run). Without Numba
+the same functions fall back to plain NumPy.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+def split_mask(xs, dw):
+    """
+    Flag points that start a new polyline after a date-line wrap
+
+    Args:
+        xs: Screen x coordinates of a trail
+        dw: Display width in pixels
+
+    Returns:
+        ndarray: bool mask, True where the segment ending at that point
+                 jumps across the map and must not be drawn
+    """
+    xs = np.asarray(xs)
+    mask = np.zeros(xs.size, dtype=np.bool_)
+    if xs.size > 1:
+        mask[1:] = np.abs(np.diff(xs.astype(np.int32))) >= dw // 2
+    return mask
+
+
+# WGS84 ellipsoid, km
+_WGS84_A = 6378.137
+_WGS84_F = 1.0 / 298.257223563
+_WGS84_E2 = 2.0 * _WGS84_F - _WGS84_F * _WGS84_F
+
+
+def _project_itrs_numpy(xyz, w, h, off_y, dw, out_xs, out_ys, out_split):
+    """NumPy version of project_itrs()"""
+    x, y, z = xyz
+    r = np.hypot(x, y)
+    lat = np.arctan2(z, r)
+    for _ in range(3):
+        e2_sin_lat = _WGS84_E2 * np.sin(lat)
+        a_c = _WGS84_A / np.sqrt(1.0 - e2_sin_lat * np.sin(lat))
+        lat = np.arctan2(z + a_c * e2_sin_lat, r)
+    lon = np.arctan2(y, x)
+
+    out_xs[:] = ((np.degrees(lon) + 180.0) * (w / 360.0)).astype(np.int32)
+    out_ys[:] = ((90.0 - np.degrees(lat)) * (h / 180.0)).astype(np.int32) + off_y
+    out_split[:] = split_mask(out_xs, dw)
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _project_itrs_numba(xyz, w, h, off_y, dw, out_xs, out_ys, out_split):
+        """Numba version of project_itrs()"""
+        sx = w / 360.0
+        sy = h / 180.0
+        half = dw // 2
+        prev_x = 0
+        for i in range(xyz.shape[1]):
+            x = xyz[0, i]
+            y = xyz[1, i]
+            z = xyz[2, i]
+            r = np.sqrt(x * x + y * y)
+            lat = np.arctan2(z, r)
+            for _ in range(3):
+                sin_lat = np.sin(lat)
+                e2_sin_lat = _WGS84_E2 * sin_lat
+                a_c = _WGS84_A / np.sqrt(1.0 - e2_sin_lat * sin_lat)
+                lat = np.arctan2(z + a_c * e2_sin_lat, r)
+            lon = np.arctan2(y, x)
+
+            px = int((np.degrees(lon) + 180.0) * sx)
+            out_xs[i] = px
+            out_ys[i] = int((90.0 - np.degrees(lat)) * sy) + off_y
+            out_split[i] = i > 0 and abs(px - prev_x) >= half
+            prev_x = px
+
+
+def project_itrs(xyz, w, h, off_y, dw, out_xs, out_ys, out_split):
+    """
+    Project Earth-fixed positions straight to map pixels in one pass
+
+    Fuses the WGS84 geodetic latitude iteration, the equirectangular
+    projection and the date-line split test, writing into caller-owned
+    buffers instead of building lat/lon/elevation arrays.
+
+    Args:
+        xyz: (3, T) ITRS positions in km, e.g. position.frame_xyz(itrs).km
+        w: Map width in pixels
+        h: Map height in pixels
+        off_y: Vertical offset of the map on the widget
+        dw: Display width in pixels
+        out_xs: (T,) int16 output for screen x
+        out_ys: (T,) int16 output for screen y
+        out_split: (T,) bool output, see split_mask()
+    """
+    xyz = np.ascontiguousarray(xyz, dtype=np.float64)
+    if HAVE_NUMBA:
+        _project_itrs_numba(xyz, w, h, off_y, dw, out_xs, out_ys, out_split)
+    else:
+        _project_itrs_numpy(xyz, w, h, off_y, dw, out_xs, out_ys, out_split)
@@ -0,0 +1,125 @@
+"""Numeric kernels for the topographical map
+
+Compiled with Numba when it is installed (the compiled code is cached on
+disk, so the compile cost is only paid on the first run). Without Numba
+the same functions fall back to plain NumPy.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _minmax_numba(patch):
+        """Numba version of minmax()"""
+        mn = patch[0, 0]
+        mx = mn
+        for i in range(patch.shape[0]):
+            for j in range(patch.shape[1]):
+                v = patch[i, j]
+                if v < mn:
+                    mn = v
+                elif v > mx:
+                    mx = v
+        return mn, mx
+
+    @njit(cache=True)
+    def _quantize_numba(values, lo, scale, out):
+        """Numba version of quantize()"""
+        for i in range(values.shape[0]):
+            for j in range(values.shape[1]):
+                out[i, j] = np.uint8((values[i, j] - lo) * scale)
+
+
+def minmax(patch):
+    """
+    Find the lowest and highest elevation of a patch in one pass
+
+    Args:
+        patch: 2D elevation array (a view is fine)
+
+    Returns:
+        tuple: (min, max) elevation
+    """
+    if HAVE_NUMBA:
+        return _minmax_numba(patch)
+    return np.min(patch), np.max(patch)
+
+
+def quantize(values, lo, hi):
+    """
+    Map elevations onto 0-255 colour table indices
+
+    Args:
+        values: 2D elevation array (a transposed view is fine)
+        lo: Elevation mapped to index 0
+        hi: Elevation mapped to index 255, must be greater than lo
+
+    Returns:
+        ndarray: uint8 indices with the same shape as values
+    """
+    scale = 255.0 / (hi - lo)
+    if HAVE_NUMBA:
+        out = np.empty(values.shape, dtype=np.uint8)
+        _quantize_numba(values, lo, scale, out)
+        return out
+    return ((values - lo) * scale).astype(np.uint8)
+
+
+def _segment_length_stats_numpy(verts, starts, sample_size):
+    """NumPy version of segment_length_stats()"""
+    diffs = np.diff(verts, axis=0)
+    lengths = np.hypot(diffs[:, 0], diffs[:, 1])
+    # Drop the joins between one path's last vertex and the next one's first
+    keep = np.ones(lengths.size, dtype=np.bool_)
+    keep[starts[1:] - 1] = False
+    lengths = lengths[keep][:sample_size]
+    return np.mean(lengths), np.std(lengths)
+
+
+if HAVE_NUMBA:
+    @njit(cache=True)
+    def _segment_length_stats_numba(verts, starts, sample_size):
+        """Numba version of segment_length_stats()"""
+        acc = 0.0
+        acc2 = 0.0
+        count = 0
+        n_paths = starts.size
+        for p in range(n_paths):
+            end = starts[p + 1] if p + 1 < n_paths else verts.shape[0]
+            for i in range(starts[p] + 1, end):
+                dx = verts[i, 0] - verts[i - 1, 0]
+                dy = verts[i, 1] - verts[i - 1, 1]
+                length = np.sqrt(dx * dx + dy * dy)
+                acc += length
+                acc2 += length * length
+                count += 1
+                if count >= sample_size:
+                    break
+            if count >= sample_size:
+                break
+        mean = acc / count
+        return mean, np.sqrt(max(acc2 / count - mean * mean, 0.0))
+
+
+def segment_length_stats(verts, starts, sample_size):
+    """
+    Mean and standard deviation of the first contour segment lengths
+
+    Args:
+        verts: (N, 2) vertices of consecutive paths, concatenated
+        starts: Index of each path's first vertex in verts
+        sample_size: Maximum number of segments to measure
+
+    Returns:
+        tuple: (mean, std) segment length
+    """
+    starts = np.asarray(starts, dtype=np.int64)
+    if HAVE_NUMBA:
+        return _segment_length_stats_numba(verts, starts, sample_size)
+    return _segment_length_stats_numpy(verts, starts, sample_size)
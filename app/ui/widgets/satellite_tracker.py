@@ -4,11 +4,16 @@ Adds Richmond, Virginia crosshair as GPS stand-in and calculates when selected
 satellite will be close enough for RTL-SDR reception.
 """
 import os
+import json
+import time
+import threading
+from collections import deque
 import pygame
 import numpy as np
 from ui.widgets.sprite import LcarsWidget
+from ui.widgets._sat_kernels import project_itrs, split_mask
 from datetime import datetime, timedelta
-
+from email.utils import formatdate
 
 class LcarsSatelliteTracker(LcarsWidget):
     """
@@ -40,6 +45,12 @@ class LcarsSatelliteTracker(LcarsWidget):
         self.map_height = self.map_width // 2
         self.map_offset_y = (self.display_height - self.map_height) // 2
         
+        # Pixels per degree (and degrees per pixel) for the map projection
+        self._sx = self.map_width / 360.0
+        self._sy = self.map_height / 180.0
+        self._inv_sx = 360.0 / self.map_width
+        self._inv_sy = 180.0 / self.map_height
+        
         # Info display areas
         self.top_bar_height = self.map_offset_y
         self.bottom_bar_height = self.display_height - self.map_height - self.map_offset_y
@@ -59,21 +70,32 @@ class LcarsSatelliteTracker(LcarsWidget):
         
         # Satellite tracking data
         self.satellites = {}
-        self.satellite_info = {}
+        self._sat_names = []  # Fixed satellite order for the position arrays
+        self._sat_index = {}  # sat_name -> index into the position arrays
+        self._sat_lats = np.empty(0)
+        self._sat_lons = np.empty(0)
+        self._sat_alts = np.empty(0)
+        self._sat_vels = np.empty((0, 3))  # (N, 3) geocentric velocity, km/s
         self.ts = None
         self.earth_map = None
         self.earth_map_path = earth_map_path
         
-        # TLE cache configuration
+        # Orbital element cache configuration
         # Need multiple groups: weather (NOAA/METEOR), stations (ISS), amateur (ham sats)
+        # Fetched as OMM JSON, which Skyfield builds satellites from directly
         self.tle_urls = [
-            'https://celestrak.org/NORAD/elements/gp.php?GROUP=weather&FORMAT=tle',
-            'https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=tle',  # ISS
-            'https://celestrak.org/NORAD/elements/gp.php?GROUP=amateur&FORMAT=tle',   # Ham sats
+            'https://celestrak.org/NORAD/elements/gp.php?GROUP=weather&FORMAT=json',
+            'https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=json',  # ISS
+            'https://celestrak.org/NORAD/elements/gp.php?GROUP=amateur&FORMAT=json',   # Ham sats
         ]
-        self.cache_file = '/tmp/all_satellites.tle'
+        self.omm_cache_file = '/tmp/all_satellites.json'  # group -> OMM records
         self.cache_expiry_hours = 6
         self.last_tle_update = None
+        self._http = None  # requests.Session, kept for connection reuse
+        
+        # Mini trail cache - lets quick restarts draw trails on the first frame
+        self.trail_cache_file = '/tmp/sat_trails.npz'
+        self.trail_cache_expiry_seconds = 60
         
         # Satellites to track (RTL-SDR demodulatable)
         self.satellite_list = [
@@ -86,11 +108,14 @@ class LcarsSatelliteTracker(LcarsWidget):
             ('AO-91', 145.960, 'FM Voice'),
             ('AO-92', 145.880, 'FM Voice'),
         ]
+        self._sat_meta = {name: (freq, mod) for name, freq, mod in self.satellite_list}
         
         # Selected satellite
         self.selected_satellite = None
         self.tracking_enabled = False  # NEW: Track calculation only enabled via SCAN button
         self.last_tracking_state = False  # Track previous state to avoid immediate recalc
+        self.click_threshold = 20  # Max pixel distance for a tap to select a satellite
+        self._click_threshold2 = self.click_threshold * self.click_threshold
         
         # Pass prediction data
         self.next_pass_info = None  # Will store: time_until, duration, max_elevation
@@ -98,24 +123,83 @@ class LcarsSatelliteTracker(LcarsWidget):
         # Trail data
         self.mini_trail_minutes_past = 5  # REDUCED: Shorter trail (was 20)
         self.mini_trail_minutes_future = 20  # RESTORED: Keep future trail longer
-        self.mini_trails = {}
+        self._trail_xs = None  # (N, T) int16 screen x, row order matches _sat_names
+        self._trail_ys = None  # (N, T) int16 screen y
+        self._trail_splits = None  # (N, T) date-line split mask
+        self._trail_num_past = 0  # Column of the current position in each trail
+        self._trail_segments = None  # [(color, points)] polylines, built on first draw
+        # Off-screen (xs, ys, splits) set the next trail refresh writes into;
+        # front and spare swap on every refresh so no new arrays are needed
+        self._spare_trail_buffers = None
+        # Trail sample offsets from now never change, so build them once
+        trail_minutes, self._trail_offsets_num_past = self._trail_minutes()
+        self._trail_offsets_jd = trail_minutes / (24 * 60)
         
         # Display state for selected satellite
         self.current_lat = None
         self.current_lon = None
         self.current_alt_km = None
         self.current_velocity_kms = None
-        self.ground_track_points = []
-        self.future_track_points = []
+        self.ground_track_points = np.empty((0, 2), dtype=np.int32)  # (N, 2) screen points
+        self._ground_track_runs = []  # Point lists split at the date line
+        self.future_track_points = np.empty((0, 2), dtype=np.int32)
+        self._future_track_runs = []  # [(color, thickness, points)] polylines
         self.pass_segments = []  # Info about each receivable pass
         self.track_minutes_past = 10  # REDUCED: Shorter trail (was 90)
         self.track_minutes_future = 180
+        self.max_future_minutes = 1440  # Pass search window (24 hours)
+        
+        # Whole-minute (minute, lat, lon, alt_km) samples of the tracked
+        # satellite, slid forward by the propagation worker
+        self._track_samples = deque()
+        self._track_samples_satellite = None
+        self._track_samples_minute = None  # minute_now the window was built for
         
         # Animation state
-        self.pulse_phase = 0
-        self.last_update_time = 0  # Position updates every 100ms
+        # Pulse radius per animation step, one full sine cycle in 64 steps
+        self._pulse_lut = (10 + 4 * np.sin(np.linspace(0, 2 * np.pi, 64, endpoint=False))).astype(int).tolist()
+        self._pulse_idx = 0
+        self._next_prop_time = 0.0  # Positions move on at most every 100ms
         self.last_trail_update_time = 0  # Mini trail updates every 5 seconds
         
+        # Render cache - the widget image is only recomposed when positions
+        # tick or the view changes, other frames blit it as is
+        self._static_bg = None  # Earth map + target crosshair
+        self._render_key = None
+        
+        # SGP4 propagation cadence - ground speed is ~7.8 km/s, which is well
+        # under a pixel per frame, so propagate at 1 Hz and interpolate between
+        self.propagation_interval = 1.0  # seconds
+        self.last_propagation_time = 0
+        self.position_samples = None  # ((lats0, lons0, t0), (lats1, lons1, t1))
+        
+        # SGP4 runs on a background thread started by initialize_tracking();
+        # results are swapped in under the lock
+        self._prop_thread = None
+        self._prop_poll_interval = 0.1  # seconds between worker wakeups
+        self._result_lock = threading.Lock()
+        self._pending_result = None
+        
+        # Fonts are loaded once, keyed by point size
+        font_sizes = (12, 16, 18, 22, 24, 28)
+        try:
+            self._fonts = {size: pygame.font.Font("assets/swiss911.ttf", size)
+                           for size in font_sizes}
+        except Exception:
+            self._fonts = {size: pygame.font.SysFont('monospace', size)
+                           for size in font_sizes}
+        self._text_cache = {}  # (font, text, color) -> rendered Surface
+        
+        # Semi-transparent label backgrounds keyed by alpha, allocated once;
+        # each label blits just the area it needs
+        label_bg_height = max(font.get_linesize() for font in self._fonts.values()) + 2
+        self._label_bg = {}
+        for alpha in (150, 180, 200):
+            bg = pygame.Surface((self.display_width, label_bg_height))
+            bg.set_alpha(alpha)
+            bg.fill((0, 0, 0))
+            self._label_bg[alpha] = bg
+        
         # Load Earth map if provided
         if earth_map_path:
             self.load_earth_map(earth_map_path)
@@ -123,6 +207,22 @@ class LcarsSatelliteTracker(LcarsWidget):
         # Initialize satellite tracking (lazy load)
         self.initialized = False
     
+    @property
+    def satellite_info(self):
+        """
+        Current positions as {sat_name: {'lat', 'lon', 'alt_km', 'velocity_kms'}}
+        
+        velocity_kms is the geocentric (x, y, z) velocity vector in km/s.
+        Built on demand from the position arrays for code outside the
+        widget; drawing and hit-testing use the arrays directly.
+        """
+        return {
+            name: {'lat': lat, 'lon': lon, 'alt_km': alt, 'velocity_kms': vel}
+            for name, lat, lon, alt, vel in zip(self._sat_names, self._sat_lats.tolist(),
+                                                self._sat_lons.tolist(), self._sat_alts.tolist(),
+                                                self._sat_vels)
+        }
+    
     def enable_tracking(self):
         """Enable detailed track calculation for selected satellite (called when SCAN pressed)"""
         if self.selected_satellite:
@@ -143,11 +243,15 @@ class LcarsSatelliteTracker(LcarsWidget):
         try:
             print("Loading Earth map: {}".format(image_path))
             self.earth_map = pygame.image.load(image_path).convert()
+            # transform.scale returns a new surface - convert that one too so
+            # the per-frame blit is a straight copy in display format
             self.earth_map = pygame.transform.scale(
                 self.earth_map, 
                 (self.map_width, self.map_height)
-            )
+            ).convert()
             self.earth_map_path = image_path
+            self._static_bg = None
+            self._render_key = None
             print("Earth map loaded successfully: {}x{}".format(
                 self.map_width, self.map_height))
             return True
@@ -156,39 +260,74 @@ class LcarsSatelliteTracker(LcarsWidget):
             return False
     
     def _download_tle_data(self):
-        """Download fresh TLE data from CelesTrak (multiple groups)"""
+        """
+        Download fresh orbital elements from CelesTrak (multiple groups)
+        
+        Groups already in the cache are requested with If-Modified-Since;
+        a 304 answer keeps the cached records without downloading them.
+        """
         try:
-            import requests
-            print("Downloading TLE data from multiple groups...")
+            if self._http is None:
+                import requests
+                self._http = requests.Session()
+            print("Downloading orbital elements from multiple groups...")
+            
+            cached_groups = self._read_omm_cache() or {}
+            if cached_groups:
+                since = formatdate(os.path.getmtime(self.omm_cache_file), usegmt=True)
             
-            all_tle_data = []
+            groups = {}
+            changed = False
             
             # Download each group
             for url in self.tle_urls:
                 group_name = url.split('GROUP=')[1].split('&')[0]
                 print("  Fetching {} group...".format(group_name))
-                response = requests.get(url, timeout=10)
+                headers = {}
+                if group_name in cached_groups:
+                    headers['If-Modified-Since'] = since
+                response = self._http.get(url, headers=headers, timeout=10)
+                if response.status_code == 304:
+                    groups[group_name] = cached_groups[group_name]
+                    continue
                 response.raise_for_status()
-                all_tle_data.append(response.text)
+                groups[group_name] = response.json()
+                changed = True
             
-            # Combine all TLE data into one file
-            with open(self.cache_file, 'w') as f:
-                f.write('\n'.join(all_tle_data))
+            if changed:
+                with open(self.omm_cache_file, 'w') as f:
+                    json.dump(groups, f)
+            else:
+                # Nothing new - just restart the expiry clock
+                os.utime(self.omm_cache_file)
             
             self.last_tle_update = datetime.now()
-            print("TLE data downloaded and cached ({} groups)".format(len(self.tle_urls)))
+            print("Orbital elements {} ({} groups)".format(
+                "downloaded and cached" if changed else "unchanged", len(self.tle_urls)))
             return True
         except Exception as e:
             print("Failed to download TLE data: {}".format(e))
             return False
     
+    def _read_omm_cache(self):
+        """Read the cached OMM records, or None if there is no usable cache"""
+        if not os.path.exists(self.omm_cache_file):
+            return None
+        try:
+            with open(self.omm_cache_file) as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            print("Failed to read orbital element cache: {}".format(e))
+            return None
+    
     def _load_tle_from_cache(self):
         """Load TLE data from cache file"""
-        if not os.path.exists(self.cache_file):
+        cache_file = self.omm_cache_file
+        if not os.path.exists(cache_file):
             return False
         
         # Check if cache is expired
-        file_time = datetime.fromtimestamp(os.path.getmtime(self.cache_file))
+        file_time = datetime.fromtimestamp(os.path.getmtime(cache_file))
         age_hours = (datetime.now() - file_time).total_seconds() / 3600
         
         if age_hours > self.cache_expiry_hours:
@@ -199,6 +338,88 @@ class LcarsSatelliteTracker(LcarsWidget):
         self.last_tle_update = file_time
         return True
     
+    def _load_satellites(self):
+        """
+        Build Skyfield satellites from the cached orbital elements
+        
+        Returns:
+            list: EarthSatellite objects from the OMM JSON cache, empty if
+                  there is no usable cache
+        """
+        from skyfield.api import EarthSatellite
+        
+        groups = self._read_omm_cache()
+        if groups is None:
+            return []
+        
+        return [EarthSatellite.from_omm(self.ts, fields)
+                for records in groups.values()
+                for fields in records]
+    
+    def _trail_minutes(self):
+        """
+        Sample offsets for the mini trails
+        
+        Returns:
+            tuple: (minutes, num_past) - offsets from now in minutes, and the
+                   index of the current position within them
+        """
+        past_minutes = np.arange(-self.mini_trail_minutes_past, 0, 2)
+        future_minutes = np.arange(2, self.mini_trail_minutes_future, 2)
+        return np.concatenate((past_minutes, [0], future_minutes)), len(past_minutes)
+    
+    def _save_trail_cache(self, trail_xs, trail_ys):
+        """Save mini trails to disk as compact int16 screen coordinates"""
+        try:
+            np.savez(self.trail_cache_file, names=np.array(self._sat_names),
+                     xs=trail_xs, ys=trail_ys, geometry=self._trail_geometry())
+        except Exception as e:
+            print("Failed to save trail cache: {}".format(e))
+    
+    def _trail_geometry(self):
+        """Map layout the cached trail coordinates were projected with"""
+        return np.array([self.map_width, self.map_height,
+                         self.map_offset_y, self.display_width])
+    
+    def _load_trail_cache(self):
+        """Load mini trails saved by a recent run so the first frame has content"""
+        if not os.path.exists(self.trail_cache_file):
+            return False
+        
+        age_seconds = time.time() - os.path.getmtime(self.trail_cache_file)
+        if age_seconds > self.trail_cache_expiry_seconds:
+            return False
+        
+        try:
+            with np.load(self.trail_cache_file) as data:
+                names = data['names'].tolist()
+                trail_xs = data['xs'].astype(np.int16)
+                trail_ys = data['ys'].astype(np.int16)
+                # Caches from before the layout was saved can't be checked
+                geometry = data['geometry'] if 'geometry' in data.files else None
+        except Exception as e:
+            print("Failed to load trail cache: {}".format(e))
+            return False
+        
+        # Only usable if it was written for the same satellites, trail length
+        # and map layout - the coordinates are screen pixels
+        num_past = self._trail_offsets_num_past
+        if names != self._sat_names or trail_xs.shape != (len(names), len(self._trail_offsets_jd)):
+            return False
+        if geometry is None or not np.array_equal(geometry, self._trail_geometry()):
+            return False
+        
+        # Cached trails stand in until the regular trail refresh replaces them
+        self._trail_xs = trail_xs
+        self._trail_ys = trail_ys
+        self._trail_splits = np.array([split_mask(xs, self.display_width) for xs in trail_xs])
+        self._trail_segments = None
+        self._trail_num_past = num_past
+        self.last_trail_update_time = pygame.time.get_ticks()
+        print("Using cached trails for {} satellites ({:.0f} s old)".format(
+            len(names), age_seconds))
+        return True
+    
     def initialize_tracking(self):
         """Initialize satellite tracking with TLE data"""
         try:
@@ -210,12 +431,15 @@ class LcarsSatelliteTracker(LcarsWidget):
                     print("ERROR: Could not load or download TLE data")
                     return False
             
-            # Load TLE data
-            satellites_data = load.tle_file(self.cache_file)
-            print("Loaded {} satellites from TLE file".format(len(satellites_data)))
+            # Initialize timescale
+            self.ts = load.timescale()
+            
+            # Load orbital elements
+            satellites_data = self._load_satellites()
+            print("Loaded {} satellites from cache".format(len(satellites_data)))
             
             if len(satellites_data) == 0:
-                print("ERROR: No satellites found in TLE file")
+                print("ERROR: No satellites found in orbital element cache")
                 return False
             
             # Build dictionary of satellites by name
@@ -244,13 +468,19 @@ class LcarsSatelliteTracker(LcarsWidget):
                 print("ERROR: No weather satellites found in TLE data")
                 return False
             
-            # Initialize timescale
-            self.ts = load.timescale()
+            self._sat_names = list(self.satellites)
+            self._sat_index = {name: i for i, name in enumerate(self._sat_names)}
             
             print("Satellite tracking initialized: {} satellites loaded".format(
                 len(self.satellites)))
             
+            self._load_trail_cache()
+            
             self.initialized = True
+            
+            if self._prop_thread is None:
+                self._prop_thread = threading.Thread(target=self._prop_loop, daemon=True)
+                self._prop_thread.start()
             return True
             
         except ImportError as e:
@@ -372,262 +602,420 @@ class LcarsSatelliteTracker(LcarsWidget):
             return None
     
     def update_satellite_positions(self):
-        """Update current satellite positions and predictions"""
+        """Pick up finished propagation results and keep displayed positions moving"""
         if not self.satellites or not self.ts:
             return
         
-        try:
-            from skyfield.api import wgs84
+        self._pulse_idx = (self._pulse_idx + 1) & 63
+        
+        # Swap in the latest result from the propagation worker. Applying
+        # under the lock keeps the worker from starting its next pass
+        # against half-swapped state
+        with self._result_lock:
+            if self._pending_result is not None:
+                self._apply_propagation_result(self._pending_result)
+                self._pending_result = None
+        
+        # SGP4 only runs once per propagation interval, in between
+        # interpolate the last samples
+        self._interpolate_positions(time.monotonic())
+    
+    def _prop_loop(self):
+        """
+        Background propagation thread
+        
+        Runs SGP4 once per propagation interval, or right away when tracking
+        is toggled, and hands the result to the render loop through
+        self._pending_result. It waits for each result to be applied before
+        computing the next one, so while the widget is hidden it idles.
+        """
+        while True:
+            time.sleep(self._prop_poll_interval)
             
-            t = self.ts.now()
-            self.pulse_phase = (self.pulse_phase + 0.1) % (2 * np.pi)
+            with self._result_lock:
+                if self._pending_result is not None:
+                    continue
             
-            # Update all satellite positions
-            self.satellite_info = {}
-            for sat_name, satellite in self.satellites.items():
-                geocentric = satellite.at(t)
-                subpoint = wgs84.subpoint(geocentric)
-                
-                self.satellite_info[sat_name] = {
-                    'lat': subpoint.latitude.degrees,
-                    'lon': subpoint.longitude.degrees,
-                    'alt_km': subpoint.elevation.km,
-                    'velocity_kms': geocentric.velocity.km_per_s
-                }
+            now = time.monotonic()
+            tracking_enabled = self.tracking_enabled
+            selected_satellite = self.selected_satellite
+            if (tracking_enabled == self.last_tracking_state and
+                    now - self.last_propagation_time < self.propagation_interval):
+                continue
+            self.last_propagation_time = now
+            self.last_tracking_state = tracking_enabled
             
-            # Update mini trails for all satellites (when no tracking active)
-            # Update trails less frequently (every 5 seconds) to avoid lag
-            if not self.tracking_enabled:
-                current_time_ms = pygame.time.get_ticks()
-                time_since_trail_update = current_time_ms - self.last_trail_update_time
-                
-                # Recalculate trails only every 5 seconds, or if we don't have any yet
-                should_update_trails = (
-                    len(self.mini_trails) == 0 or 
-                    time_since_trail_update > 5000
-                )
-                
-                if should_update_trails:
-                    self.mini_trails = {}
-                    for sat_name, satellite in self.satellites.items():
-                        past_points = []
-                        future_points = []
-                        
-                        # Past trail
-                        for minutes_ago in range(self.mini_trail_minutes_past, 0, -2):
-                            t_past = self.ts.ut1_jd(t.ut1 - minutes_ago / (24 * 60))
-                            geocentric_past = satellite.at(t_past)
-                            sub_past = wgs84.subpoint(geocentric_past)
-                            screen_pos = self._latlon_to_screen(
-                                sub_past.latitude.degrees,
-                                sub_past.longitude.degrees
-                            )
-                            past_points.append(screen_pos)
-                        
-                        # Add current position to connect past and future trails
-                        current_pos = self._latlon_to_screen(
-                            self.satellite_info[sat_name]['lat'],
-                            self.satellite_info[sat_name]['lon']
-                        )
-                        past_points.append(current_pos)  # End of past trail
-                        future_points.insert(0, current_pos)  # Start of future trail
-                        
-                        # Future trail
-                        for minutes_ahead in range(2, self.mini_trail_minutes_future, 2):
-                            t_future = self.ts.ut1_jd(t.ut1 + minutes_ahead / (24 * 60))
-                            geocentric_future = satellite.at(t_future)
-                            sub_future = wgs84.subpoint(geocentric_future)
-                            screen_pos = self._latlon_to_screen(
-                                sub_future.latitude.degrees,
-                                sub_future.longitude.degrees
-                            )
-                            future_points.append(screen_pos)
-                        
-                        self.mini_trails[sat_name] = {
-                            'past': past_points,
-                            'future': future_points
-                        }
-                    
-                    self.last_trail_update_time = current_time_ms
-            else:
-                # When tracking is enabled, clear mini trails to save memory
-                # They'll be recalculated when tracking is disabled
-                if len(self.mini_trails) > 0:
-                    self.mini_trails = {}
+            try:
+                result = self._propagate(tracking_enabled, selected_satellite, now)
+            except Exception as e:
+                print("Error updating satellite positions: {}".format(e))
+                continue
+            
+            with self._result_lock:
+                self._pending_result = result
+    
+    def _apply_propagation_result(self, result):
+        """Swap a finished propagation result into the display state"""
+        self._sat_lats = result['lats']
+        self._sat_lons = result['lons']
+        self._sat_alts = result['alts']
+        self._sat_vels = result['vels']
+        self.position_samples = result['position_samples']
+        
+        if result['trails'] is not None:
+            if self._trail_xs is not None:
+                self._spare_trail_buffers = (self._trail_xs, self._trail_ys, self._trail_splits)
+            (self._trail_xs, self._trail_ys,
+             self._trail_splits, self._trail_num_past) = result['trails']
+            self._trail_segments = None
+            self.last_trail_update_time = result['trail_update_time']
+        
+        # Drop tracks computed for a selection/tracking state that has since changed
+        if (result['tracking_enabled'] != self.tracking_enabled or
+                result['selected_satellite'] != self.selected_satellite):
+            return
+        
+        track = result['track']
+        if track is not None:
+            self.current_lat = track['lat']
+            self.current_lon = track['lon']
+            self.current_alt_km = track['alt_km']
+            self.current_velocity_kms = track['velocity_kms']
+            self.ground_track_points = track['ground_track_points']
+            self._ground_track_runs = track['ground_track_runs']
+            self.future_track_points = track['future_track_points']
+            self._future_track_runs = track['future_track_runs']
+            self.pass_segments = track['pass_segments']
+            self.next_pass_info = track['next_pass_info']
+        else:
+            self.current_lat = None
+            self.current_lon = None
+            self.current_alt_km = None
+            self.current_velocity_kms = None
+            self.ground_track_points = np.empty((0, 2), dtype=np.int32)
+            self._ground_track_runs = []
+            self.future_track_points = np.empty((0, 2), dtype=np.int32)
+            self._future_track_runs = []
+            self.next_pass_info = None
+            self.pass_segments = []
+    
+    def _propagate(self, tracking_enabled, selected_satellite, sample_time):
+        """
+        Compute satellite positions, mini trails and the detailed track
+        
+        Runs on the propagation worker thread, so it only builds new objects
+        and never mutates the state the render loop is drawing from.
+        
+        Returns:
+            dict: Result to be applied by _apply_propagation_result()
+        """
+        from skyfield.api import wgs84
+        from skyfield.framelib import itrs
+        
+        t = self.ts.now()
+        
+        # Update all satellite positions, in _sat_names order
+        n = len(self._sat_names)
+        lats = np.empty(n)
+        lons = np.empty(n)
+        alts = np.empty(n)
+        vels = np.empty((n, 3))
+        selected_geocentric = None  # Reused for the tracked satellite's velocity
+        for i, sat_name in enumerate(self._sat_names):
+            geocentric = self.satellites[sat_name].at(t)
+            subpoint = wgs84.subpoint(geocentric)
+            lats[i] = subpoint.latitude.degrees
+            lons[i] = subpoint.longitude.degrees
+            alts[i] = subpoint.elevation.km
+            vels[i] = geocentric.velocity.km_per_s
+            if sat_name == selected_satellite:
+                selected_geocentric = geocentric
+        
+        # Keep the last two samples for interpolation
+        sample = (lats, lons, sample_time)
+        previous = self.position_samples
+        
+        result = {
+            'tracking_enabled': tracking_enabled,
+            'selected_satellite': selected_satellite,
+            'lats': lats,
+            'lons': lons,
+            'alts': alts,
+            'vels': vels,
+            'position_samples': (previous[1] if previous else sample, sample),
+            'trails': None,  # None = keep current trails
+            'trail_update_time': None,
+            'track': None
+        }
+        
+        # Update mini trails for all satellites (when no tracking active)
+        # Update trails less frequently (every 5 seconds) to avoid lag
+        if not tracking_enabled:
+            current_time_ms = pygame.time.get_ticks()
+            time_since_trail_update = current_time_ms - self.last_trail_update_time
             
-            # Store current tracking state
-            self.last_tracking_state = self.tracking_enabled
+            # Recalculate trails only every 5 seconds, or if we don't have any yet
+            should_update_trails = (
+                self._trail_xs is None or 
+                time_since_trail_update > 5000
+            )
             
-            # Update detailed track ONLY when tracking is enabled (via SCAN button)
-            if self.tracking_enabled and self.selected_satellite and self.selected_satellite in self.satellites:
-                satellite = self.satellites[self.selected_satellite]
-                geocentric = satellite.at(t)
-                subpoint = wgs84.subpoint(geocentric)
-                
-                self.current_lat = subpoint.latitude.degrees
-                self.current_lon = subpoint.longitude.degrees
-                self.current_alt_km = subpoint.elevation.km
+            if should_update_trails:
+                # One vectorized SGP4 call per satellite covering past trail,
+                # current position and future trail
+                trail_times = self.ts.ut1_jd(t.ut1 + self._trail_offsets_jd)
+                num_past = self._trail_offsets_num_past
                 
-                vel = geocentric.velocity.km_per_s
-                self.current_velocity_kms = np.sqrt(vel[0]**2 + vel[1]**2 + vel[2]**2)
-                
-                # Calculate past ground track
-                self.ground_track_points = []
-                for minutes_ago in range(self.track_minutes_past, 0, -1):
-                    t_past = self.ts.ut1_jd(t.ut1 - minutes_ago / (24 * 60))
-                    geocentric_past = satellite.at(t_past)
-                    sub = wgs84.subpoint(geocentric_past)
-                    screen_pos = self._latlon_to_screen(
-                        sub.latitude.degrees,
-                        sub.longitude.degrees
-                    )
-                    self.ground_track_points.append(screen_pos)
-                
-                # Calculate future ground track - extend to show next 2 passes
-                self.future_track_points = []
-                max_future_minutes = 1440  # Search up to 24 hours ahead
-                self.pass_segments = []  # Store info about each receivable pass
-                
-                current_pass = None
-                passes_found = 0
-                max_passes = 2  # Only show next 2 passes
-                stop_at_minute = None  # Will be set after finding passes
-                
-                for minutes_ahead in range(1, max_future_minutes):
-                    # Stop drawing track shortly after the second pass ends
-                    if stop_at_minute is not None and minutes_ahead > stop_at_minute:
-                        break
-                    
-                    t_future = self.ts.ut1_jd(t.ut1 + minutes_ahead / (24 * 60))
-                    geocentric_future = satellite.at(t_future)
-                    sub = wgs84.subpoint(geocentric_future)
-                    
-                    screen_pos = self._latlon_to_screen(
-                        sub.latitude.degrees,
-                        sub.longitude.degrees
-                    )
-                    self.future_track_points.append(screen_pos)
-                    
-                    # Check if satellite is close enough to target for reception
-                    distance, elevation = self._calculate_distance_and_elevation(
-                        sub.latitude.degrees,
-                        sub.longitude.degrees,
-                        sub.elevation.km
-                    )
-                    
-                    # Track receivable passes
-                    is_receivable = (elevation >= self.min_elevation_angle and 
-                                   distance <= self.max_reception_distance)
-                    
-                    if is_receivable:
-                        if current_pass is None:
-                            # Start of a new pass
-                            current_pass = {
-                                'start_minute': minutes_ahead,
-                                'start_lon': sub.longitude.degrees,  # NEW: Track start longitude
-                                'max_elevation': elevation,
-                                'max_elevation_minute': minutes_ahead,
-                                'max_elevation_lon': sub.longitude.degrees,  # NEW: Track peak longitude
-                                'end_minute': minutes_ahead
-                            }
-                        else:
-                            # Continue current pass
-                            current_pass['end_minute'] = minutes_ahead
-                            if elevation > current_pass['max_elevation']:
-                                current_pass['max_elevation'] = elevation
-                                current_pass['max_elevation_minute'] = minutes_ahead
-                                current_pass['max_elevation_lon'] = sub.longitude.degrees  # NEW: Update peak longitude
-                    else:
-                        if current_pass is not None:
-                            # End of pass - save it
-                            current_pass['duration'] = current_pass['end_minute'] - current_pass['start_minute']
-                            
-                            # NEW: Calculate direction (East or West)
-                            # Satellites move west-to-east or east-to-west based on longitude change
-                            lon_change = current_pass['max_elevation_lon'] - current_pass['start_lon']
-                            
-                            # Handle dateline crossing
-                            if lon_change > 180:
-                                lon_change -= 360
-                            elif lon_change < -180:
-                                lon_change += 360
-                            
-                            # Determine cardinal direction based on longitude change
-                            if abs(lon_change) < 5:
-                                # Nearly overhead, check if trending east or west
-                                direction = "N" if lon_change >= 0 else "S"
-                            else:
-                                # Clear east or west movement
-                                direction = "E" if lon_change > 0 else "W"
-                            
-                            current_pass['direction'] = direction
-                            
-                            self.pass_segments.append(current_pass)
-                            passes_found += 1
-                            
-                            # After finding 2 passes, set stop point 30 min after last pass
-                            if passes_found >= max_passes:
-                                stop_at_minute = current_pass['end_minute'] + 30
-                            
-                            current_pass = None
-                
-                # Save final pass if we ended in the middle of one
-                if current_pass is not None and passes_found < max_passes:
-                    current_pass['duration'] = current_pass['end_minute'] - current_pass['start_minute']
-                    
-                    # NEW: Calculate direction for final pass too
-                    lon_change = current_pass['max_elevation_lon'] - current_pass['start_lon']
-                    if lon_change > 180:
-                        lon_change -= 360
-                    elif lon_change < -180:
-                        lon_change += 360
-                    direction = "E" if lon_change > 0 else "W"
-                    if abs(lon_change) < 5:
-                        direction = "N" if lon_change >= 0 else "S"
-                    current_pass['direction'] = direction
-                    
-                    self.pass_segments.append(current_pass)
+                # Write into the spare buffers - they are not on screen, and
+                # only become the front set once this result is applied
+                trail_shape = (n, len(self._trail_offsets_jd))
+                spare = self._spare_trail_buffers
+                if spare is not None and spare[0].shape == trail_shape:
+                    trail_xs, trail_ys, trail_splits = spare
+                else:
+                    trail_xs = np.empty(trail_shape, dtype=np.int16)
+                    trail_ys = np.empty(trail_shape, dtype=np.int16)
+                    trail_splits = np.empty(trail_shape, dtype=np.bool_)
+                for i, sat_name in enumerate(self._sat_names):
+                    # Earth-fixed km straight to pixels, no subpoint objects
+                    xyz = self.satellites[sat_name].at(trail_times).frame_xyz(itrs).km
+                    project_itrs(xyz, self.map_width, self.map_height,
+                                 self.map_offset_y, self.display_width,
+                                 trail_xs[i], trail_ys[i], trail_splits[i])
                 
+                result['trails'] = (trail_xs, trail_ys, trail_splits, num_past)
+                result['trail_update_time'] = current_time_ms
+                self._save_trail_cache(trail_xs, trail_ys)
+        elif self._trail_xs is not None:
+            # When tracking is enabled, hide the mini trails - their arrays
+            # become the spare buffers for when tracking is disabled again
+            result['trails'] = (None, None, None, 0)
+            result['trail_update_time'] = self.last_trail_update_time
+        
+        # Update detailed track ONLY when tracking is enabled (via SCAN button)
+        if tracking_enabled and selected_satellite and selected_satellite in self.satellites:
+            # Per-minute samples from the past track to 24 hours ahead
+            lats, lons, alts = self._sample_track(selected_satellite, t)
+            
+            points = np.stack(self._latlon_to_screen_array(lats, lons), axis=1)
+            now_index = self.track_minutes_past
+            future = slice(now_index + 1, None)
+            
+            # Check where the satellite is close enough to target for reception
+            distance, elevation = self._calculate_distance_and_elevation(
+                lats[future], lons[future], alts[future]
+            )
+            receivable = ((elevation >= self.min_elevation_angle) &
+                          (distance <= self.max_reception_distance))
+            pass_segments, stop_at_minute = self._find_passes(
+                receivable, elevation, lons[future]
+            )
+            
+            # Stop drawing track shortly after the second pass ends
+            future_track_points = points[future]
+            if stop_at_minute is not None:
+                future_track_points = future_track_points[:stop_at_minute]
+                receivable = receivable[:stop_at_minute]
+            
+            # Current position is the exact sample taken above, not the
+            # whole-minute track sample
+            index = self._sat_index[selected_satellite]
+            vel = selected_geocentric.velocity.km_per_s
+            result['track'] = {
+                'lat': result['lats'][index],
+                'lon': result['lons'][index],
+                'alt_km': result['alts'][index],
+                'velocity_kms': np.sqrt(vel[0]**2 + vel[1]**2 + vel[2]**2),
+                'ground_track_points': points[:now_index],
+                'ground_track_runs': self._split_polyline(points[:now_index]),
+                'future_track_points': future_track_points,
+                'future_track_runs': self._build_track_runs(future_track_points, receivable),
+                'pass_segments': pass_segments,
                 # Predict next pass over target location
-                self.next_pass_info = self._predict_next_pass()
-            else:
-                self.current_lat = None
-                self.current_lon = None
-                self.current_alt_km = None
-                self.current_velocity_kms = None
-                self.ground_track_points = []
-                self.future_track_points = []
-                self.next_pass_info = None
-                self.pass_segments = []
+                'next_pass_info': self._predict_next_pass()
+            }
+        
+        return result
+    
+    def _sample_track(self, sat_name, t):
+        """
+        Subpoints of a satellite at whole minutes around the current time
+        
+        Runs on the propagation worker, which owns the sample deque. As time
+        moves on only the newly needed minutes are propagated and the oldest
+        ones drop off the front; the whole window is only re-propagated when
+        the satellite changes or after a gap longer than the past track.
+        
+        Args:
+            sat_name: Satellite to sample
+            t: Current Skyfield time
             
-        except Exception as e:
-            print("Error updating satellite positions: {}".format(e))
+        Returns:
+            tuple: (lats, lons, alts_km) arrays covering track_minutes_past
+                   minutes ago up to max_future_minutes - 1 minutes ahead
+        """
+        from skyfield.api import wgs84
+        
+        minute_now = int(t.ut1 * 24 * 60)
+        last_minute = minute_now + self.max_future_minutes - 1
+        window = self.track_minutes_past + self.max_future_minutes
+        
+        samples = self._track_samples
+        if (sat_name != self._track_samples_satellite or not samples or
+                samples.maxlen != window or
+                minute_now < self._track_samples_minute or
+                minute_now - self._track_samples_minute > self.track_minutes_past):
+            samples = self._track_samples = deque(maxlen=window)
+            self._track_samples_satellite = sat_name
+            first_new = minute_now - self.track_minutes_past
+        else:
+            first_new = samples[-1][0] + 1
+        self._track_samples_minute = minute_now
+        
+        if first_new <= last_minute:
+            minutes = np.arange(first_new, last_minute + 1)
+            geocentric = self.satellites[sat_name].at(self.ts.ut1_jd(minutes / (24 * 60)))
+            sub = wgs84.subpoint(geocentric)
+            samples.extend(zip(minutes.tolist(),
+                               sub.latitude.degrees.tolist(),
+                               sub.longitude.degrees.tolist(),
+                               sub.elevation.km.tolist()))
+        
+        _, lats, lons, alts = np.array(samples).T
+        return lats, lons, alts
+    
+    def _find_passes(self, receivable, elevation, lons, max_passes=2):
+        """
+        Find receivable passes along the future track
+        
+        Args:
+            receivable: bool array, one entry per minute starting 1 minute ahead
+            elevation: Elevation angles (degrees) for the same minutes
+            lons: Satellite longitudes (degrees) for the same minutes
+            max_passes: Only report this many passes
+            
+        Returns:
+            tuple: (pass_segments, stop_at_minute) - stop_at_minute is 30 min
+                   after the last reported pass ends, or None
+        """
+        # Runs of receivable minutes, as inclusive index ranges
+        edges = np.diff(np.concatenate(([0], receivable.astype(np.int8), [0])))
+        starts = np.flatnonzero(edges == 1)
+        ends = np.flatnonzero(edges == -1) - 1
+        
+        pass_segments = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            peak = start + int(np.argmax(elevation[start:end + 1]))
+            current_pass = {
+                'start_minute': start + 1,
+                'start_lon': lons[start],
+                'max_elevation': elevation[peak],
+                'max_elevation_minute': peak + 1,
+                'max_elevation_lon': lons[peak],
+                'end_minute': end + 1,
+                'duration': end - start
+            }
+            current_pass['direction'] = self._pass_direction(
+                current_pass['start_lon'], current_pass['max_elevation_lon']
+            )
+            pass_segments.append(current_pass)
+            
+            # After finding enough passes, stop 30 min after the last one
+            # (a pass still in progress at the end of the window never stops it)
+            if len(pass_segments) >= max_passes and end < len(receivable) - 1:
+                return pass_segments, current_pass['end_minute'] + 30
+        
+        return pass_segments, None
+    
+    def _pass_direction(self, start_lon, peak_lon):
+        """
+        Cardinal direction of a pass from its start to its peak
+        
+        Returns:
+            str: "E"/"W" for clear east or west movement, else "N"/"S"
+        """
+        lon_change = peak_lon - start_lon
+        
+        # Handle dateline crossing
+        if lon_change > 180:
+            lon_change -= 360
+        elif lon_change < -180:
+            lon_change += 360
+        
+        if abs(lon_change) < 5:
+            # Nearly overhead, check if trending east or west
+            return "N" if lon_change >= 0 else "S"
+        return "E" if lon_change > 0 else "W"
+    
+    def _interpolate_positions(self, now):
+        """
+        Move displayed positions along between SGP4 samples
+        
+        Linearly extends the motion between the last two samples so markers
+        keep moving smoothly while propagation only runs at 1 Hz.
+        
+        Args:
+            now: Current time.monotonic() value
+        """
+        if self.position_samples is None:
+            return
+        
+        (lats0, lons0, t0), (lats1, lons1, t1) = self.position_samples
+        if t1 <= t0:
+            return
+        
+        alpha = (now - t0) / (t1 - t0)
+        # Handle longitude wrap at the date line
+        delta_lon = (lons1 - lons0 + 540) % 360 - 180
+        self._sat_lats = np.clip(lats0 + alpha * (lats1 - lats0), -90.0, 90.0)
+        self._sat_lons = (lons0 + alpha * delta_lon + 540) % 360 - 180
+        
+        index = self._sat_index.get(self.selected_satellite)
+        if index is not None and self.current_lat is not None:
+            self.current_lat = float(self._sat_lats[index])
+            self.current_lon = float(self._sat_lons[index])
     
     def _latlon_to_screen(self, lat, lon):
         """Convert latitude/longitude to screen pixel coordinates"""
-        x = int((lon + 180) * (self.map_width / 360))
-        y = int((90 - lat) * (self.map_height / 180)) + self.map_offset_y
+        x = int((lon + 180) * self._sx)
+        y = int((90 - lat) * self._sy) + self.map_offset_y
         return (x, y)
     
+    def _latlon_to_screen_array(self, lats, lons):
+        """
+        Convert arrays of latitude/longitude to screen pixel coordinates
+        
+        Returns:
+            tuple: (xs, ys) as int32 arrays
+        """
+        xs = ((lons + 180) * self._sx).astype(np.int32)
+        ys = ((90 - lats) * self._sy).astype(np.int32) + self.map_offset_y
+        return xs, ys
+    
     def _screen_to_latlon(self, x, y):
         """Convert screen coordinates to latitude/longitude"""
-        lon = (x / self.map_width) * 360 - 180
-        lat = 90 - ((y - self.map_offset_y) / self.map_height) * 180
+        lon = x * self._inv_sx - 180
+        lat = 90 - (y - self.map_offset_y) * self._inv_sy
         return (lat, lon)
     
     def _draw_earth_map(self, surface):
-        """Draw the Earth map background"""
+        """
+        Draw the Earth map background
+        
+        Only called when _compose() builds self._static_bg, so the grid
+        fallback is drawn once per map change rather than every frame.
+        """
         if self.earth_map:
             surface.blit(self.earth_map, (0, self.map_offset_y))
         else:
             surface.fill((0, 0, 0))
             # Draw grid
             for lat in range(-90, 91, 30):
-                y = int((90 - lat) * (self.map_height / 180)) + self.map_offset_y
+                y = int((90 - lat) * self._sy) + self.map_offset_y
                 pygame.draw.line(surface, (40, 40, 40), 
                                (0, y), (self.display_width, y), 1)
             for lon in range(-180, 181, 30):
-                x = int((lon + 180) * (self.map_width / 360))
+                x = int((lon + 180) * self._sx)
                 pygame.draw.line(surface, (40, 40, 40),
                                (x, self.map_offset_y), 
                                (x, self.map_offset_y + self.map_height), 1)
@@ -657,122 +1045,126 @@ class LcarsSatelliteTracker(LcarsWidget):
         if len(self.ground_track_points) < 2:
             return
         
-        for i in range(len(self.ground_track_points) - 1):
-            p1 = self.ground_track_points[i]
-            p2 = self.ground_track_points[i + 1]
+        for run in self._ground_track_runs:
+            pygame.draw.lines(surface, (255, 255, 0), False, run, 2)  # Yellow
+    
+    def _split_polyline(self, points):
+        """
+        Cut an (N, 2) screen polyline where it wraps across the date line
+        
+        Returns:
+            list: Point lists of at least 2 points, ready for pygame.draw.lines
+        """
+        wraps = np.abs(np.diff(points[:, 0])) >= self.display_width / 2
+        runs = np.split(points, np.flatnonzero(wraps) + 1)
+        return [run.tolist() for run in runs if len(run) > 1]
+    
+    def _build_track_runs(self, points, receivable):
+        """
+        Group the future track into polylines of constant receivability
+        
+        Args:
+            points: (N, 2) screen points, one per minute ahead
+            receivable: bool array, True where the segment starting at
+                        that point is within reception range
             
-            if abs(p1[0] - p2[0]) < self.display_width / 2:
-                color = (255, 255, 0)  # Yellow
-                pygame.draw.line(surface, color, p1, p2, 2)
+        Returns:
+            list: (color, thickness, points) runs, never crossing the date line
+        """
+        if len(points) < 2:
+            return []
+        
+        wraps = np.abs(np.diff(points[:, 0])) >= self.display_width / 2
+        # Per segment: 0 = out of range, 1 = receivable, 2/3 = wraps (skipped)
+        kind = receivable[:len(wraps)].astype(np.int8) + 2 * wraps
+        starts = np.concatenate(([0], np.flatnonzero(np.diff(kind)) + 1))
+        ends = np.concatenate((starts[1:], [len(kind)]))
+        
+        runs = []
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            if kind[start] == 1:
+                runs.append(((0, 255, 0), 3, points[start:end + 1].tolist()))  # Green - receivable zone!
+            elif kind[start] == 0:
+                runs.append(((0, 255, 255), 2, points[start:end + 1].tolist()))  # Cyan - future track
+        return runs
     
     def _draw_future_track(self, surface):
         """Draw the satellite's predicted future ground track with reception zones highlighted"""
         if len(self.future_track_points) < 2:
             return
         
-        try:
-            from skyfield.api import wgs84
-            
-            if not self.selected_satellite or self.selected_satellite not in self.satellites:
-                return
-            
-            satellite = self.satellites[self.selected_satellite]
-            t = self.ts.now()
+        # Colors were worked out with the track, so no SGP4 here
+        for color, thickness, points in self._future_track_runs:
+            pygame.draw.lines(surface, color, False, points, thickness)
+        
+        # Draw markers at the peak of each pass
+        font_tiny = self._fonts[12]
+        for i, pass_info in enumerate(self.pass_segments[:2]):  # Mark only next 2 passes
+            max_elev_minute = pass_info['max_elevation_minute']
             
-            # Draw future track with color coding for receivability
-            for i in range(len(self.future_track_points) - 1):
-                p1 = self.future_track_points[i]
-                p2 = self.future_track_points[i + 1]
+            if max_elev_minute < len(self.future_track_points):
+                marker_pos = self.future_track_points[max_elev_minute].tolist()
                 
-                # Only draw if line doesn't cross the date line
-                if abs(p1[0] - p2[0]) < self.display_width / 2:
-                    # Calculate position at this point in the future track
-                    minutes_ahead = i + 1
-                    t_future = self.ts.ut1_jd(t.ut1 + minutes_ahead / (24 * 60))
-                    geocentric_future = satellite.at(t_future)
-                    sub = wgs84.subpoint(geocentric_future)
-                    
-                    # Check if receivable at this point
-                    distance, elevation = self._calculate_distance_and_elevation(
-                        sub.latitude.degrees,
-                        sub.longitude.degrees,
-                        sub.elevation.km
-                    )
-                    
-                    # Color code: green if receivable, cyan if not
-                    if elevation >= self.min_elevation_angle and distance <= self.max_reception_distance:
-                        color = (0, 255, 0)  # Green - receivable zone!
-                        thickness = 3  # Thicker line for receivable portions
-                    else:
-                        color = (0, 255, 255)  # Cyan - future track
-                        thickness = 2
-                    
-                    pygame.draw.line(surface, color, p1, p2, thickness)
-            
-            # Draw markers at the peak of each pass
-            font_tiny = pygame.font.Font("assets/swiss911.ttf", 12)
-            for i, pass_info in enumerate(self.pass_segments[:2]):  # Mark only next 2 passes
-                max_elev_minute = pass_info['max_elevation_minute']
+                # Draw a circle marker at peak elevation
+                pygame.draw.circle(surface, (255, 255, 0), marker_pos, 6, 2)
+                pygame.draw.circle(surface, (0, 255, 0), marker_pos, 3)
                 
-                if max_elev_minute < len(self.future_track_points):
-                    marker_pos = self.future_track_points[max_elev_minute]
-                    
-                    # Draw a circle marker at peak elevation
-                    pygame.draw.circle(surface, (255, 255, 0), marker_pos, 6, 2)
-                    pygame.draw.circle(surface, (0, 255, 0), marker_pos, 3)
-                    
-                    # Draw pass number label
-                    label = font_tiny.render(str(i + 1), True, (255, 255, 0))
-                    label_rect = label.get_rect(center=(marker_pos[0], marker_pos[1] - 12))
-                    
-                    # Background for label
-                    bg_surf = pygame.Surface((label_rect.width + 4, label_rect.height + 2))
-                    bg_surf.set_alpha(200)
-                    bg_surf.fill((0, 0, 0))
-                    surface.blit(bg_surf, (label_rect.x - 2, label_rect.y - 1))
-                    surface.blit(label, label_rect)
-                    
-        except Exception as e:
-            # Fallback to simple cyan line if calculation fails
-            for i in range(len(self.future_track_points) - 1):
-                p1 = self.future_track_points[i]
-                p2 = self.future_track_points[i + 1]
-                if abs(p1[0] - p2[0]) < self.display_width / 2:
-                    pygame.draw.line(surface, (0, 255, 255), p1, p2, 2)
+                # Draw pass number label
+                label = self._render_text(font_tiny, str(i + 1), (255, 255, 0))
+                label_rect = label.get_rect(center=(marker_pos[0], marker_pos[1] - 12))
+                
+                # Background for label
+                surface.blit(self._label_bg[200], (label_rect.x - 2, label_rect.y - 1),
+                             (0, 0, label_rect.width + 4, label_rect.height + 2))
+                surface.blit(label, label_rect)
     
     def _draw_mini_trails(self, surface):
         """Draw mini trails for all satellites in overview mode"""
-        if not self.mini_trails:
+        if self._trail_xs is None:
             return
         
-        for sat_name, trails in self.mini_trails.items():
-            # Draw past trail
-            past_points = trails['past']
-            if len(past_points) > 1:
-                for i in range(len(past_points) - 1):
-                    p1 = past_points[i]
-                    p2 = past_points[i + 1]
-                    if abs(p1[0] - p2[0]) < self.display_width / 2:
-                        pygame.draw.line(surface, (200, 200, 0), p1, p2, 1)
-            
-            # Draw future trail
-            future_points = trails['future']
-            if len(future_points) > 1:
-                for i in range(len(future_points) - 1):
-                    p1 = future_points[i]
-                    p2 = future_points[i + 1]
-                    if abs(p1[0] - p2[0]) < self.display_width / 2:
-                        pygame.draw.line(surface, (0, 200, 200), p1, p2, 1)
+        # Polylines are only rebuilt once per trail refresh
+        if self._trail_segments is None:
+            self._trail_segments = self._build_trail_segments()
+        
+        for color, points in self._trail_segments:
+            pygame.draw.lines(surface, color, False, points, 1)
+    
+    def _build_trail_segments(self):
+        """
+        Cut the mini trails into polylines that never cross the date line
+        
+        Returns:
+            list: (color, points) pairs ready for pygame.draw.lines
+        """
+        segments = []
+        num_past = self._trail_num_past
+        # Past trail runs up to the current position, future trail from it
+        parts = ((slice(0, num_past + 1), (200, 200, 0)),
+                 (slice(num_past, None), (0, 200, 200)))
+        
+        for xs, ys, splits in zip(self._trail_xs, self._trail_ys, self._trail_splits):
+            points = np.stack((xs, ys), axis=1)
+            for part, color in parts:
+                breaks = np.flatnonzero(splits[part][1:]) + 1
+                for run in np.split(points[part], breaks):
+                    if len(run) > 1:
+                        segments.append((color, run.tolist()))
+        return segments
     
     def _draw_all_satellites(self, surface):
         """Draw all satellite positions, highlighting selected one if any"""
-        if not self.satellite_info:
+        if not len(self._sat_lats):
             return
         
-        font_small = pygame.font.Font("assets/swiss911.ttf", 18)  # INCREASED from 16
+        font_small = self._fonts[18]  # INCREASED from 16
         
-        for sat_name, info in self.satellite_info.items():
-            pos = self._latlon_to_screen(info['lat'], info['lon'])
+        xs, ys = self._latlon_to_screen_array(self._sat_lats, self._sat_lons)
+        xs = xs.tolist()
+        ys = ys.tolist()
+        for i in range(len(xs)):
+            sat_name = self._sat_names[i]
+            pos = (xs[i], ys[i])
             
             # Check if this is the selected satellite
             is_selected = (sat_name == self.selected_satellite)
@@ -788,39 +1180,39 @@ class LcarsSatelliteTracker(LcarsWidget):
                 pygame.draw.circle(surface, (255, 255, 255), pos, 3)
                 color = (255, 153, 0)  # Orange text for unselected
             
-            label_text = font_small.render(sat_name, True, color)
+            label_text = self._render_text(font_small, sat_name, color)
             label_rect = label_text.get_rect(topleft=(pos[0] + 8, pos[1] - 8))  # ADJUSTED offset
             
-            bg_surf = pygame.Surface((label_rect.width + 4, label_rect.height + 2))
-            bg_surf.set_alpha(180)
-            bg_surf.fill((0, 0, 0))
-            surface.blit(bg_surf, (label_rect.x - 2, label_rect.y - 1))
+            surface.blit(self._label_bg[180], (label_rect.x - 2, label_rect.y - 1),
+                         (0, 0, label_rect.width + 4, label_rect.height + 2))
             surface.blit(label_text, label_rect)
     
     def _draw_other_satellites(self, surface):
         """Draw other satellites (not selected) when one is selected"""
-        if not self.satellite_info or not self.selected_satellite:
+        if not len(self._sat_lats) or not self.selected_satellite:
             return
         
-        font_small = pygame.font.Font("assets/swiss911.ttf", 16)  # INCREASED from 14
+        font_small = self._fonts[16]  # INCREASED from 14
         
-        for sat_name, info in self.satellite_info.items():
+        xs, ys = self._latlon_to_screen_array(self._sat_lats, self._sat_lons)
+        xs = xs.tolist()
+        ys = ys.tolist()
+        for i in range(len(xs)):
+            sat_name = self._sat_names[i]
             if sat_name == self.selected_satellite:
                 continue
             
-            pos = self._latlon_to_screen(info['lat'], info['lon'])
+            pos = (xs[i], ys[i])
             
             # INCREASED: Larger dimmed satellites (was 3/1)
             pygame.draw.circle(surface, (150, 100, 0), pos, 5)
             pygame.draw.circle(surface, (200, 200, 200), pos, 2)
             
-            label_text = font_small.render(sat_name, True, (150, 100, 0))
+            label_text = self._render_text(font_small, sat_name, (150, 100, 0))
             label_rect = label_text.get_rect(topleft=(pos[0] + 7, pos[1] - 7))  # ADJUSTED offset
             
-            bg_surf = pygame.Surface((label_rect.width + 3, label_rect.height + 2))
-            bg_surf.set_alpha(150)
-            bg_surf.fill((0, 0, 0))
-            surface.blit(bg_surf, (label_rect.x - 1, label_rect.y - 1))
+            surface.blit(self._label_bg[150], (label_rect.x - 1, label_rect.y - 1),
+                         (0, 0, label_rect.width + 3, label_rect.height + 2))
             surface.blit(label_text, label_rect)
     
     def _draw_satellite_position(self, surface):
@@ -831,7 +1223,7 @@ class LcarsSatelliteTracker(LcarsWidget):
         pos = self._latlon_to_screen(self.current_lat, self.current_lon)
         
         # ENHANCED: Larger pulse effect for better visibility
-        pulse_size = int(10 + 4 * np.sin(self.pulse_phase))  # INCREASED from (6 + 2)
+        pulse_size = self._pulse_lut[self._pulse_idx]  # INCREASED from (6 + 2)
         
         # Draw pulsing outer circle
         pygame.draw.circle(surface, (255, 0, 0), pos, pulse_size)
@@ -857,29 +1249,23 @@ class LcarsSatelliteTracker(LcarsWidget):
     
     def _draw_info_overlay(self, surface):
         """Draw text information overlay"""
-        font_medium = pygame.font.Font("assets/swiss911.ttf", 28)  # INCREASED from 24
-        font_small = pygame.font.Font("assets/swiss911.ttf", 22)  # INCREASED from 20
+        font_medium = self._fonts[28]  # INCREASED from 24
+        font_small = self._fonts[22]  # INCREASED from 20
         
         if self.selected_satellite:
             # Top bar - satellite info
             sat_name = self.selected_satellite
-            freq = None
-            mod = None
-            for name, f, m in self.satellite_list:
-                if name == sat_name:
-                    freq = f
-                    mod = m
-                    break
+            freq, mod = self._sat_meta.get(sat_name, (None, None))
             
             info_text = "{} - {:.4f} MHz ({})".format(sat_name, freq, mod)
-            text = font_medium.render(info_text, True, (255, 255, 255))
+            text = self._render_text(font_medium, info_text, (255, 255, 255))
             surface.blit(text, (10, 10))
             
             if self.current_alt_km and self.current_velocity_kms:
                 detail_text = "Alt: {:.0f} km  Vel: {:.2f} km/s".format(
                     self.current_alt_km, self.current_velocity_kms
                 )
-                text2 = font_small.render(detail_text, True, (153, 153, 255))
+                text2 = self._render_text(font_small, detail_text, (153, 153, 255))
                 surface.blit(text2, (10, 35))
             
             # Bottom bar - show all upcoming passes
@@ -927,13 +1313,13 @@ class LcarsSatelliteTracker(LcarsWidget):
                         )
                         pass_color = (100, 100, 200)  # Dimmer blue
                     
-                    text_pass = font_small.render(pass_text, True, pass_color)
+                    text_pass = self._render_text(font_small, pass_text, pass_color)
                     surface.blit(text_pass, (10, y_offset))
                     y_offset -= 20  # Move up for next pass
                 
             else:
                 no_pass_text = "No good passes in next 24 hours"
-                text3 = font_small.render(no_pass_text, True, (255, 100, 100))
+                text3 = self._render_text(font_small, no_pass_text, (255, 100, 100))
                 surface.blit(text3, (10, self.display_height - 25))
             
             # Current distance/elevation to target
@@ -953,29 +1339,41 @@ class LcarsSatelliteTracker(LcarsWidget):
                 
                 # Position this above the pass list (2 passes instead of 4)
                 y_pos = self.display_height - 25 - (20 * min(len(self.pass_segments), 2)) - 5
-                text4 = font_small.render(status_text, True, status_color)
+                text4 = self._render_text(font_small, status_text, status_color)
                 surface.blit(text4, (10, y_pos))
         else:
             # No satellite selected - show overview info
             title_text = "SATELLITE TRACKER - Click satellite to select"
-            text = font_medium.render(title_text, True, (153, 153, 255))
+            text = self._render_text(font_medium, title_text, (153, 153, 255))
             surface.blit(text, (10, 10))
             
             target_text = "Target: {} ({:.4f}°N, {:.4f}°W)".format(
                 self.target_name, self.target_lat, abs(self.target_lon)
             )
-            text2 = font_small.render(target_text, True, (0, 255, 0))
+            text2 = self._render_text(font_small, target_text, (0, 255, 0))
             surface.blit(text2, (10, 35))
     
+    def _render_text(self, font, text, color):
+        """Render antialiased text, reusing the Surface for repeated strings"""
+        key = (font, text, color)
+        surf = self._text_cache.get(key)
+        if surf is None:
+            # Changing readouts (distance, elevation) keep adding strings
+            if len(self._text_cache) > 256:
+                self._text_cache.clear()
+            surf = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surf
+        return surf
+    
     def _draw_no_data_message(self, surface):
         """Draw message when satellite data unavailable"""
-        font = pygame.font.Font("assets/swiss911.ttf", 24)  # Increased from 20
-        text = font.render("SATELLITE DATA UNAVAILABLE", True, (255, 100, 100))
+        font = self._fonts[24]  # Increased from 20
+        text = self._render_text(font, "SATELLITE DATA UNAVAILABLE", (255, 100, 100))
         text_rect = text.get_rect(center=(self.display_width // 2, self.display_height // 2 - 40))
         surface.blit(text, text_rect)
         
-        font_small = pygame.font.Font("assets/swiss911.ttf", 18)  # Increased from 16
-        text2 = font_small.render("Check network connection and TLE data", True, (153, 153, 255))
+        font_small = self._fonts[18]  # Increased from 16
+        text2 = self._render_text(font_small, "Check network connection and TLE data", (153, 153, 255))
         text2_rect = text2.get_rect(center=(self.display_width // 2, self.display_height // 2))
         surface.blit(text2, text2_rect)
     
@@ -988,42 +1386,74 @@ class LcarsSatelliteTracker(LcarsWidget):
         if not self.initialized:
             self.initialize_tracking()
         
-        # Clear surface
-        self.image.fill((0, 0, 0))
-        
         if not self.initialized:
+            self.image.fill((0, 0, 0))
             self._draw_no_data_message(self.image)
             screen.blit(self.image, self.rect)
             self.dirty = 0
             return
         
         # Update satellite positions periodically
-        current_time = pygame.time.get_ticks()
-        if current_time - self.last_update_time > 100:
+        now = time.monotonic()
+        ticked = now >= self._next_prop_time
+        if ticked:
+            self._next_prop_time = now + 0.1
             self.update_satellite_positions()
-            self.last_update_time = current_time
         
-        # Draw components
-        self._draw_earth_map(self.image)
-        self._draw_target_crosshair(self.image)  # Always draw target
+        # Nothing on the map moves between position ticks, and even on a
+        # tick the overview often looks the same - only recompose when the
+        # render state actually changed
+        if (ticked or self._render_key is None or
+                self._render_key[:2] != (self.tracking_enabled, self.selected_satellite)):
+            render_key = self._render_state()
+            if render_key != self._render_key:
+                self._render_key = render_key
+                self._compose(self.image)
+        
+        screen.blit(self.image, self.rect)
+        self.dirty = 0
+    
+    def _render_state(self):
+        """
+        Snapshot of everything the composed image depends on
+        
+        Returns:
+            tuple: Starts with (tracking_enabled, selected_satellite); equal
+                   tuples mean the image would come out the same
+        """
+        xs, ys = self._latlon_to_screen_array(self._sat_lats, self._sat_lons)
+        tracking = self.tracking_enabled and self.selected_satellite
+        return (self.tracking_enabled, self.selected_satellite,
+                xs.tobytes(), ys.tobytes(),
+                id(self._trail_xs),  # Changes whenever new trails are swapped in
+                # The tracked view pulses and shows live distance/elevation
+                self._pulse_idx if tracking else None,
+                self.current_lat if tracking else None)
+    
+    def _compose(self, surface):
+        """Redraw the whole widget image"""
+        # Earth map and target never change, keep them pre-rendered
+        if self._static_bg is None:
+            self._static_bg = pygame.Surface(surface.get_size()).convert()
+            self._static_bg.fill((0, 0, 0))
+            self._draw_earth_map(self._static_bg)
+            self._draw_target_crosshair(self._static_bg)  # Always draw target
+        surface.blit(self._static_bg, (0, 0))
         
         # Drawing logic based on selection and tracking state
         if self.tracking_enabled and self.selected_satellite:
             # SCAN activated: Show detailed track, hide other satellites
-            self._draw_future_track(self.image)
-            self._draw_ground_track(self.image)
-            self._draw_other_satellites(self.image)
-            self._draw_satellite_position(self.image)
+            self._draw_future_track(surface)
+            self._draw_ground_track(surface)
+            self._draw_other_satellites(surface)
+            self._draw_satellite_position(surface)
         else:
             # Normal view: Show all satellites with mini trails
             # Selected satellite will be highlighted but all are visible
-            self._draw_mini_trails(self.image)
-            self._draw_all_satellites(self.image)
-        
-        self._draw_info_overlay(self.image)
+            self._draw_mini_trails(surface)
+            self._draw_all_satellites(surface)
         
-        screen.blit(self.image, self.rect)
-        self.dirty = 0
+        self._draw_info_overlay(surface)
     
     def handleEvent(self, event, clock):
         """Handle mouse clicks to select satellites"""
@@ -1038,20 +1468,16 @@ class LcarsSatelliteTracker(LcarsWidget):
                 if y_rel < self.map_offset_y or y_rel > self.map_offset_y + self.map_height:
                     return False
                 
-                # Check if click is near any satellite
-                click_threshold = 20
+                # Check if click is near any satellite - squared pixel
+                # distance to all of them at once, no sqrt needed
                 closest_sat = None
-                closest_dist = float('inf')
                 
-                for sat_name, info in self.satellite_info.items():
-                    sat_screen_pos = self._latlon_to_screen(info['lat'], info['lon'])
-                    dx = x_rel - sat_screen_pos[0]
-                    dy = y_rel - sat_screen_pos[1]
-                    dist = np.sqrt(dx*dx + dy*dy)
-                    
-                    if dist < click_threshold and dist < closest_dist:
-                        closest_sat = sat_name
-                        closest_dist = dist
+                if len(self._sat_lats):
+                    xs, ys = self._latlon_to_screen_array(self._sat_lats, self._sat_lons)
+                    d2 = (xs - x_rel) ** 2 + (ys - y_rel) ** 2
+                    i = int(np.argmin(d2))
+                    if d2[i] < self._click_threshold2:
+                        closest_sat = self._sat_names[i]
                 
                 if closest_sat:
                     if self.selected_satellite == closest_sat:
@@ -1063,13 +1489,7 @@ class LcarsSatelliteTracker(LcarsWidget):
                         # Just select satellite (don't calculate track yet)
                         self.selected_satellite = closest_sat
                         
-                        freq = None
-                        mod = None
-                        for sat_name, f, m in self.satellite_list:
-                            if sat_name == closest_sat:
-                                freq = f
-                                mod = m
-                                break
+                        freq, mod = self._sat_meta.get(closest_sat, (None, None))
                         print("Selected satellite: {} ({} MHz {})".format(
                             closest_sat, freq, mod))
                         print("Press SCAN to show detailed track")
@@ -1,7 +1,10 @@
+import logging
 import pygame
 import numpy as np
 from ui.widgets.sprite import LcarsWidget
 
+logger = logging.getLogger(__name__)
+
 
 class LcarsSpectrumScanDisplay(LcarsWidget):
     """
@@ -19,18 +22,21 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
         """
         self.display_width = size[0]
         self.display_height = size[1]
-        self.image = pygame.Surface(size)
+        self.image = pygame.Surface(size).convert()
         self.image.fill((0, 0, 0))
         
         LcarsWidget.__init__(self, None, pos, size)
         
-        # Spectrum image (loaded from file)
+        # Spectrum image (loaded from file) and its copy scaled to the display
         self.spectrum_image = None
+        self._scaled_spectrum = None
         
         # Frequency range info (set when scan completes)
         self.freq_min = None
         self.freq_max = None
         self.bandwidth = 2.4e6  # Default bandwidth for detailed scan (2.4 MHz)
+        self._freq_scale = None      # Hz per pixel
+        self._inv_freq_scale = None  # Pixels per Hz
         
         # Selected target frequency
         self.selected_frequency = None
@@ -39,6 +45,26 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
         # Scanning state
         self.scan_complete = False
         
+        # Set by every mutator; update() only redraws self.image when set
+        self._dirty = True
+        
+        self._label_font = pygame.font.Font("assets/swiss911.ttf", 18)
+        self._placeholder_font = pygame.font.Font("assets/swiss911.ttf", 20)
+        self._scanning_surf = None
+        self._scanning_rect = None
+        
+        # Semi-transparent bandwidth box fill; a slice of it is blitted
+        self._box_tint = pygame.Surface((self.display_width, self.display_height),
+                                        pygame.SRCALPHA).convert_alpha()
+        self._box_tint.fill((255, 255, 0, 80))
+        self._box_rect = pygame.Rect(0, 0, 0, 0)
+        self._box_area = pygame.Rect(0, 0, 0, 0)
+        
+        # Rendered frequency label and its background, reused while the
+        # selection stays put
+        self._label_cache_key = None
+        self._label_cache = None
+        
     def set_frequency_range(self, freq_min, freq_max):
         """
         Set the frequency range for the displayed spectrum
@@ -50,6 +76,15 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
         self.freq_min = freq_min
         self.freq_max = freq_max
         
+        # Precompute the pixel <-> Hz scale used by the conversions
+        self._freq_scale = None
+        self._inv_freq_scale = None
+        if freq_min is not None and freq_max is not None:
+            freq_range = freq_max - freq_min
+            self._freq_scale = freq_range / self.display_width
+            self._inv_freq_scale = self.display_width / freq_range if freq_range else 0.0
+        self._dirty = True
+        
     def set_spectrum_image(self, image):
         """
         Set the spectrum scan image
@@ -58,6 +93,20 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
             image: pygame.Surface with the spectrum plot
         """
         self.spectrum_image = image
+        self._scaled_spectrum = None
+        if image is not None:
+            # Scale once here instead of on every redraw
+            size = (self.display_width, self.display_height)
+            if image.get_size() != size:
+                image = pygame.transform.scale(image, size)
+            if pygame.display.get_surface() is not None:
+                # Match the display pixel format so blits need no conversion
+                if image.get_flags() & pygame.SRCALPHA:
+                    image = image.convert_alpha()
+                else:
+                    image = image.convert()
+            self._scaled_spectrum = image
+        self._dirty = True
         
     def set_scan_complete(self, complete):
         """
@@ -85,14 +134,14 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
         # The actual plot area goes from y=0 to y=0.92*height
         # But x-axis is still full width, so no adjustment needed for x
         
-        # Calculate ratio along the display
-        ratio = float(x_pos) / self.display_width
-        ratio = max(0.0, min(1.0, ratio))
+        # Clamp to the display
+        if x_pos < 0:
+            x_pos = 0
+        elif x_pos > self.display_width:
+            x_pos = self.display_width
         
         # Linear mapping to frequency range
-        frequency = self.freq_min + ratio * (self.freq_max - self.freq_min)
-        
-        return frequency
+        return self.freq_min + x_pos * self._freq_scale
     
     def x_from_frequency(self, frequency):
         """
@@ -107,9 +156,12 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
         if self.freq_min is None or self.freq_max is None:
             return None
         
-        ratio = (frequency - self.freq_min) / (self.freq_max - self.freq_min)
-        ratio = max(0.0, min(1.0, ratio))
-        return int(ratio * self.display_width)
+        x_pos = (frequency - self.freq_min) * self._inv_freq_scale
+        if x_pos < 0:
+            return 0
+        if x_pos > self.display_width:
+            return self.display_width
+        return int(x_pos)
     
     def set_selected_frequency(self, frequency):
         """
@@ -126,11 +178,13 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
         
         self.selected_frequency = frequency
         self.selected_x = self.x_from_frequency(frequency)
+        self._dirty = True
     
     def clear_selection(self):
         """Clear the frequency selection"""
         self.selected_frequency = None
         self.selected_x = None
+        self._dirty = True
     
     def _format_frequency(self, freq_hz):
         """
@@ -153,17 +207,16 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
     
     def _draw_spectrum(self, surface):
         """Draw the spectrum image"""
-        if self.spectrum_image is None:
-            # Draw placeholder
-            font = pygame.font.Font("assets/swiss911.ttf", 20)
-            text = font.render("SCANNING...", True, (255, 255, 0))
-            text_rect = text.get_rect(center=(self.display_width // 2, self.display_height // 2))
-            surface.blit(text, text_rect)
+        if self._scaled_spectrum is None:
+            # Draw placeholder, rendered on first use
+            if self._scanning_surf is None:
+                self._scanning_surf = self._placeholder_font.render("SCANNING...", True, (255, 255, 0))
+                self._scanning_rect = self._scanning_surf.get_rect(
+                    center=(self.display_width // 2, self.display_height // 2))
+            surface.blit(self._scanning_surf, self._scanning_rect)
             return
         
-        # Scale spectrum image to fit display
-        scaled_image = pygame.transform.scale(self.spectrum_image, (self.display_width, self.display_height))
-        surface.blit(scaled_image, (0, 0))
+        surface.blit(self._scaled_spectrum, (0, 0))
     
     def _draw_selection_indicator(self, surface):
         """Draw the bandwidth selection indicator"""
@@ -186,47 +239,42 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
         
         # Draw semi-transparent bandwidth box
         box_height = self.display_height - 40
-        box_surface = pygame.Surface((x_end - x_start, box_height))
-        box_surface.set_alpha(80)
-        box_surface.fill((255, 255, 0))
-        surface.blit(box_surface, (x_start, 0))
+        self._box_rect.update(x_start, 0, x_end - x_start, box_height)
+        self._box_area.size = self._box_rect.size
+        surface.blit(self._box_tint, self._box_rect, area=self._box_area)
         
         # Draw border of bandwidth box
-        pygame.draw.rect(surface, (255, 255, 0), 
-                        (x_start, 0, x_end - x_start, box_height), 2)
-        
-        # Draw center line
-        pygame.draw.line(surface, (255, 255, 0),
-                        (self.selected_x, 0),
-                        (self.selected_x, self.display_height - 40),
-                        2)
+        pygame.draw.rect(surface, (255, 255, 0), self._box_rect, 2)
         
-        # Draw crosshair at top
+        # Draw center line and crosshair at top. Both are vertical, so they
+        # are filled as rects covering the same pixels as a 2 and 3 wide
+        # pygame.draw.line, without rasterizing a line
         crosshair_y = 20
-        pygame.draw.line(surface, (255, 255, 0),
-                        (self.selected_x, crosshair_y - 10),
-                        (self.selected_x, crosshair_y + 10), 3)
+        surface.fill((255, 255, 0),
+                     (self.selected_x, 0, 2, self.display_height - 40 + 1))
+        surface.fill((255, 255, 0),
+                     (self.selected_x - 1, crosshair_y - 10, 3, 21))
         
         # Draw frequency label with bandwidth info
-        font = pygame.font.Font("assets/swiss911.ttf", 18)
-        freq_label = "{} ± {:.1f} MHz".format(
-            self._format_frequency(self.selected_frequency),
-            self.bandwidth / 2e6
-        )
-        text = font.render(freq_label, True, (255, 255, 0))
-        text_rect = text.get_rect(center=(self.selected_x, crosshair_y + 35))
-        
-        # Draw background for text
-        padding = 5
-        bg_rect = pygame.Rect(
-            text_rect.x - padding,
-            text_rect.y - padding,
-            text_rect.width + padding * 2,
-            text_rect.height + padding * 2
-        )
-        bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-        bg_surface.set_alpha(200)
-        bg_surface.fill((0, 0, 0))
+        key = (self.selected_frequency, self.bandwidth, self.selected_x)
+        if key != self._label_cache_key:
+            freq_label = "{} ± {:.1f} MHz".format(
+                self._format_frequency(self.selected_frequency),
+                self.bandwidth / 2e6
+            )
+            text = self._label_font.render(freq_label, True, (255, 255, 0)).convert_alpha()
+            text_rect = text.get_rect(center=(self.selected_x, crosshair_y + 35))
+            
+            # Background for text, with the alpha baked into the pixels
+            padding = 5
+            bg_rect = text_rect.inflate(padding * 2, padding * 2)
+            bg_surface = pygame.Surface(bg_rect.size, pygame.SRCALPHA).convert_alpha()
+            bg_surface.fill((0, 0, 0, 200))
+            
+            self._label_cache = (bg_surface, bg_rect, text, text_rect)
+            self._label_cache_key = key
+        
+        bg_surface, bg_rect, text, text_rect = self._label_cache
         surface.blit(bg_surface, bg_rect)
         surface.blit(text, text_rect)
     
@@ -235,12 +283,16 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
         if not self.visible:
             return
         
-        # Clear surface
-        self.image.fill((0, 0, 0))
-        
-        # Draw components
-        self._draw_spectrum(self.image)
-        self._draw_selection_indicator(self.image)
+        # Redraw only after a mutator has changed something; otherwise the
+        # last image is still current
+        if self._dirty or self.dirty:
+            # Clear surface
+            self.image.fill((0, 0, 0))
+            
+            # Draw components
+            self._draw_spectrum(self.image)
+            self._draw_selection_indicator(self.image)
+            self._dirty = False
         
         # Blit to screen
         screen.blit(self.image, self.rect)
@@ -253,26 +305,29 @@ class LcarsSpectrumScanDisplay(LcarsWidget):
             self.focussed = False
             return False
         
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                self.focussed = True
-                
-                # Only allow selection if scan is complete
-                if self.scan_complete:
-                    # Convert to widget-relative coordinates
-                    x_rel = event.pos[0] - self.rect.left
-                    
-                    # Get frequency from click position
-                    frequency = self.get_frequency_from_x(x_rel)
-                    if frequency:
-                        self.set_selected_frequency(frequency)
-                        print("Selected new target frequency: {} (bandwidth: {:.1f} MHz)".format(
-                            self._format_frequency(frequency),
-                            self.bandwidth / 1e6
-                        ))
-                        return True
-        
         if event.type == pygame.MOUSEBUTTONUP:
             self.focussed = False
+            return False
+        
+        # Only clicks inside the widget can select
+        if event.type != pygame.MOUSEBUTTONDOWN or not self.rect.collidepoint(event.pos):
+            return False
         
-        return False 
+        self.focussed = True
+        
+        # Only allow selection if scan is complete
+        if self.scan_complete:
+            # Convert to widget-relative coordinates
+            x_rel = event.pos[0] - self.rect.left
+            
+            # Get frequency from click position
+            frequency = self.get_frequency_from_x(x_rel)
+            if frequency:
+                self.set_selected_frequency(frequency)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Selected new target frequency: %s (bandwidth: %.1f MHz)",
+                                 self._format_frequency(frequency),
+                                 self.bandwidth / 1e6)
+                return True
+        
+        return False
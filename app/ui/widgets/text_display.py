@@ -3,6 +3,9 @@ from pygame.font import Font
 from ui.widgets.sprite import LcarsWidget
 from ui import colours
 
+# Transparent colour of the chrome overlay; never used by the chrome itself
+_CHROME_KEY = (255, 0, 255)
+
 
 class LcarsTextDisplay(LcarsWidget):
     """
@@ -29,23 +32,17 @@ class LcarsTextDisplay(LcarsWidget):
         self.display_height = size[1]
         self.bg_color = bg_color
         
-        self.image = pygame.Surface(size)
+        self.image = pygame.Surface(size).convert()
         self.image.fill(self.bg_color)
         
         LcarsWidget.__init__(self, None, pos, size)
         
-        # Text settings
-        self.font_size = font_size
-        self.font = Font("assets/swiss911.ttf", self.font_size)
-        self.line_height = self.font_size + 4  # Add some padding
-        
         # Text content
         self.lines = []  # List of text lines to display
         self.selected_index = None  # Index of selected/highlighted line
         
         # Scroll position
         self.scroll_offset = 0  # Number of lines scrolled from top
-        self.max_visible_lines = int(self.display_height / self.line_height)
         
         # Colors
         self.text_color = (255, 255, 0)  # Yellow
@@ -53,6 +50,52 @@ class LcarsTextDisplay(LcarsWidget):
         self.selected_bg_color = (100, 100, 150)  # Blue-ish highlight
         self.border_color = (255, 255, 0)  # Bright yellow border
         
+        # Rendered line surfaces, keyed by (text, selected), and truncated
+        # versions of long lines keyed by the original string
+        self._line_cache = {}
+        self._truncated_cache = {}
+        
+        # Set by every mutator; update() only redraws self.image when set
+        self._dirty = True
+        
+        # Fixed-size fonts for the info bar and the empty placeholder
+        self._info_font = Font("assets/swiss911.ttf", 14)
+        self._empty_font = Font("assets/swiss911.ttf", 20)
+        self._nodata_surf = None
+        self._nodata_rect = None
+        
+        # Composited scrollbar, keyed by what moves the thumb
+        self._scrollbar_surf = None
+        self._scrollbar_key = None
+        
+        # Scrollbar, info bar and border on a colour-keyed overlay, keyed by
+        # the state they show
+        self._chrome_cache = None
+        self._chrome_key = None
+        
+        # Text settings
+        self.set_font_size(font_size)
+        
+    def set_font_size(self, font_size):
+        """
+        Change the font size and recompute the layout that depends on it
+        
+        Args:
+            font_size: Font size for text
+        """
+        self.font_size = font_size
+        self.font = Font("assets/swiss911.ttf", self.font_size)
+        self.line_height = self.font_size + 4  # Add some padding
+        self.max_visible_lines = int(self.display_height / self.line_height)
+        
+        # Top of each visible line slot, below a small top margin
+        self._line_ys = tuple(5 + i * self.line_height for i in range(self.max_visible_lines))
+        
+        self._line_cache.clear()
+        self._truncated_cache.clear()
+        self._clamp_scroll()
+        self._dirty = True
+        
     def set_lines(self, lines):
         """
         Set the text lines to display
@@ -61,7 +104,10 @@ class LcarsTextDisplay(LcarsWidget):
             lines: List of strings, one per line
         """
         self.lines = lines if lines else []
+        self._line_cache.clear()
+        self._truncated_cache.clear()
         self._clamp_scroll()
+        self._dirty = True
         
     def add_line(self, line):
         """
@@ -71,12 +117,16 @@ class LcarsTextDisplay(LcarsWidget):
             line: String to add
         """
         self.lines.append(line)
+        self._dirty = True
         
     def clear(self):
         """Clear all lines"""
         self.lines = []
         self.selected_index = None
         self.scroll_offset = 0
+        self._line_cache.clear()
+        self._truncated_cache.clear()
+        self._dirty = True
         
     def set_selected_index(self, index):
         """
@@ -87,15 +137,18 @@ class LcarsTextDisplay(LcarsWidget):
         """
         if index is None:
             self.selected_index = None
+            self._dirty = True
             return
             
         if 0 <= index < len(self.lines):
             self.selected_index = index
             self._scroll_to_selection()
+            self._dirty = True
         
     def scroll_to_top(self):
         """Scroll to the top of the list"""
         self.scroll_offset = 0
+        self._dirty = True
         
     def scroll_to_bottom(self):
         """Scroll to the bottom of the list"""
@@ -103,15 +156,18 @@ class LcarsTextDisplay(LcarsWidget):
             self.scroll_offset = len(self.lines) - self.max_visible_lines
         else:
             self.scroll_offset = 0
+        self._dirty = True
             
     def scroll_up(self, lines=1):
         """Scroll up by specified number of lines"""
         self.scroll_offset = max(0, self.scroll_offset - lines)
+        self._dirty = True
         
     def scroll_down(self, lines=1):
         """Scroll down by specified number of lines"""
         max_scroll = max(0, len(self.lines) - self.max_visible_lines)
         self.scroll_offset = min(max_scroll, self.scroll_offset + lines)
+        self._dirty = True
         
     def _scroll_to_selection(self):
         """Auto-scroll to keep selected line visible"""
@@ -141,46 +197,86 @@ class LcarsTextDisplay(LcarsWidget):
     def _draw_text_lines(self, surface):
         """Draw the visible text lines"""
         if not self.lines:
-            # Draw "No data" message
-            font_large = Font("assets/swiss911.ttf", 20)
-            text = font_large.render("NO DATA", True, (100, 100, 100))
-            text_rect = text.get_rect(center=(self.display_width // 2, self.display_height // 2))
-            surface.blit(text, text_rect)
+            # Draw "No data" message, rendered on first use
+            if self._nodata_surf is None:
+                self._nodata_surf = self._empty_font.render("NO DATA", True, (100, 100, 100))
+                self._nodata_rect = self._nodata_surf.get_rect(
+                    center=(self.display_width // 2, self.display_height // 2))
+            surface.blit(self._nodata_surf, self._nodata_rect)
             return
             
         # Calculate visible range
         start_line = self.scroll_offset
         end_line = min(len(self.lines), start_line + self.max_visible_lines)
         
-        # Draw each visible line
-        y_pos = 5  # Small top margin
-        for i in range(start_line, end_line):
-            line_text = self.lines[i]
+        # Draw selection highlight background (at most one line)
+        selected = self.selected_index
+        if selected is not None and start_line <= selected < end_line:
+            sel_y = self._line_ys[selected - start_line] - 2
+            surface.fill(self.selected_bg_color,
+                         (2, sel_y, self.display_width - 4, self.line_height))
+        
+        # Collect each visible line, then blit them all in one call
+        blit_seq = [(self._get_rendered(self.lines[i], i == selected), (10, y_pos))
+                    for i, y_pos in zip(range(start_line, end_line), self._line_ys)]
+        
+        # fblits is pygame-ce only; blits without return values otherwise
+        fblits = getattr(surface, "fblits", None)
+        if fblits is not None:
+            fblits(blit_seq)
+        else:
+            surface.blits(blit_seq, doreturn=False)
             
-            # Determine if this line is selected
-            is_selected = (i == self.selected_index)
+    def _truncate(self, line_text):
+        """
+        Shorten a line that is too wide for the display
+        
+        Measures the rendered width, so the result is cached per line.
+        
+        Args:
+            line_text: Original line
             
-            # Draw selection highlight background
-            if is_selected:
-                highlight_rect = pygame.Rect(2, y_pos - 2, 
-                                            self.display_width - 4, 
-                                            self.line_height)
-                pygame.draw.rect(surface, self.selected_bg_color, highlight_rect)
+        Returns:
+            The line, or the longest prefix that fits followed by "..."
+        """
+        truncated = self._truncated_cache.get(line_text)
+        if truncated is None:
+            # Left margin of 10 plus the 12 pixel scrollbar and a small gap
+            max_width = self.display_width - 24
+            truncated = line_text
+            if self.font.size(line_text)[0] > max_width:
+                # Binary search for the longest prefix that fits with "..."
+                lo, hi = 0, len(line_text) - 1
+                while lo < hi:
+                    mid = (lo + hi + 1) // 2
+                    if self.font.size(line_text[:mid] + "...")[0] <= max_width:
+                        lo = mid
+                    else:
+                        hi = mid - 1
+                truncated = line_text[:lo] + "..."
+            self._truncated_cache[line_text] = truncated
+        return truncated
+        
+    def _get_rendered(self, line_text, is_selected):
+        """
+        Get the rendered surface for a line, rendering it on first use
+        
+        Args:
+            line_text: Original line
+            is_selected: True to render in the selected colour
             
-            # Choose text color
+        Returns:
+            pygame.Surface with the (truncated) line
+        """
+        key = (line_text, is_selected)
+        text_surface = self._line_cache.get(key)
+        if text_surface is None:
             text_color = self.selected_color if is_selected else self.text_color
-            
-            # Truncate line if too long
-            max_chars = 2*int((self.display_width - 20) / (self.font_size * 0.6))
-            if len(line_text) > max_chars:
-                line_text = line_text[:max_chars - 3] + "..."
-            
-            # Render text
-            text_surface = self.font.render(line_text, True, text_color)
-            surface.blit(text_surface, (10, y_pos))
-            
-            y_pos += self.line_height
-            
+            text_surface = self.font.render(self._truncate(line_text), True, text_color)
+            text_surface = text_surface.convert_alpha()
+            self._line_cache[key] = text_surface
+        return text_surface
+        
     def _draw_scrollbar(self, surface):
         """Draw scrollbar indicator if content is scrollable"""
         if len(self.lines) <= self.max_visible_lines:
@@ -192,20 +288,27 @@ class LcarsTextDisplay(LcarsWidget):
         bar_y = 4
         bar_height = self.display_height - 8
         
-        # Draw scrollbar track
-        pygame.draw.rect(surface, (50, 50, 50), 
-                        (bar_x, bar_y, bar_width, bar_height))
-        
-        # Calculate thumb size and position
-        thumb_ratio = self.max_visible_lines / len(self.lines)
-        thumb_height = max(20, int(bar_height * thumb_ratio))
-        
-        scroll_ratio = self.scroll_offset / max(1, len(self.lines) - self.max_visible_lines)
-        thumb_y = bar_y + int((bar_height - thumb_height) * scroll_ratio)
-        
-        # Draw scrollbar thumb
-        pygame.draw.rect(surface, self.border_color,
-                        (bar_x, thumb_y, bar_width, thumb_height))
+        # Rebuild the track + thumb surface only when the thumb moves
+        key = (self.scroll_offset, len(self.lines), self.max_visible_lines)
+        if key != self._scrollbar_key:
+            if self._scrollbar_surf is None:
+                self._scrollbar_surf = pygame.Surface((bar_width, bar_height)).convert()
+            
+            # Scrollbar track
+            self._scrollbar_surf.fill((50, 50, 50))
+            
+            # Calculate thumb size and position
+            thumb_ratio = self.max_visible_lines / len(self.lines)
+            thumb_height = max(20, int(bar_height * thumb_ratio))
+            
+            scroll_ratio = self.scroll_offset / max(1, len(self.lines) - self.max_visible_lines)
+            thumb_y = int((bar_height - thumb_height) * scroll_ratio)
+            
+            # Scrollbar thumb
+            self._scrollbar_surf.fill(self.border_color, (0, thumb_y, bar_width, thumb_height))
+            self._scrollbar_key = key
+            
+        surface.blit(self._scrollbar_surf, (bar_x, bar_y))
         
     def _draw_info_bar(self, surface):
         """Draw info bar at bottom showing line count and position"""
@@ -234,23 +337,49 @@ class LcarsTextDisplay(LcarsWidget):
             )
         
         # Render info text
-        info_font = Font("assets/swiss911.ttf", 14)
-        text_surface = info_font.render(info_text, True, (150, 150, 150))
+        text_surface = self._info_font.render(info_text, True, (150, 150, 150))
         surface.blit(text_surface, (10, info_y + 3))
         
+    def _get_chrome(self):
+        """
+        Get the overlay with the scrollbar, info bar and border
+        
+        Rebuilt only when the scroll position, selection or line count
+        changes.
+        
+        Returns:
+            pygame.Surface, transparent outside the chrome
+        """
+        key = (self.scroll_offset, self.selected_index, len(self.lines),
+               self.max_visible_lines)
+        if key != self._chrome_key:
+            if self._chrome_cache is None:
+                self._chrome_cache = pygame.Surface(
+                    (self.display_width, self.display_height)).convert()
+                self._chrome_cache.set_colorkey(_CHROME_KEY)
+            
+            self._chrome_cache.fill(_CHROME_KEY)
+            self._draw_scrollbar(self._chrome_cache)
+            self._draw_info_bar(self._chrome_cache)
+            self._draw_border(self._chrome_cache)
+            self._chrome_key = key
+        return self._chrome_cache
+        
     def update(self, screen):
         """Update and render the text display"""
         if not self.visible:
             return
         
-        # Clear surface
-        self.image.fill(self.bg_color)
-        
-        # Draw components
-        self._draw_text_lines(self.image)
-        self._draw_scrollbar(self.image)
-        self._draw_info_bar(self.image)
-        self._draw_border(self.image)
+        # Redraw only after a mutator (or the screen via self.dirty) has
+        # changed something; otherwise the last image is still current
+        if self._dirty or self.dirty:
+            # Clear surface
+            self.image.fill(self.bg_color)
+            
+            # Draw components
+            self._draw_text_lines(self.image)
+            self.image.blit(self._get_chrome(), (0, 0))
+            self._dirty = False
         
         # Blit to screen
         screen.blit(self.image, self.rect)
@@ -262,28 +391,29 @@ class LcarsTextDisplay(LcarsWidget):
         if not self.visible:
             return False
         
-        # Mouse wheel scrolling
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                # Mouse wheel up (button 4)
-                if event.button == 4:
-                    self.scroll_up(3)
-                    return True
-                # Mouse wheel down (button 5)
-                elif event.button == 5:
-                    self.scroll_down(3)
-                    return True
-                # Left click - select line
-                elif event.button == 1:
-                    # Convert to widget-relative coordinates
-                    y_rel = event.pos[1] - self.rect.top
-                    
-                    # Calculate which line was clicked
-                    line_index = int((y_rel - 5) / self.line_height) + self.scroll_offset
-                    
-                    if 0 <= line_index < len(self.lines):
-                        self.set_selected_index(line_index)
-                        return True
+        # Only button presses inside the widget are handled
+        if event.type != pygame.MOUSEBUTTONDOWN or not self.rect.collidepoint(event.pos):
+            return False
+        
+        # Mouse wheel up (button 4)
+        if event.button == 4:
+            self.scroll_up(3)
+            return True
+        # Mouse wheel down (button 5)
+        elif event.button == 5:
+            self.scroll_down(3)
+            return True
+        # Left click - select line
+        elif event.button == 1:
+            # Convert to widget-relative coordinates
+            y_rel = event.pos[1] - self.rect.top
+            
+            # Calculate which line was clicked
+            line_index = int((y_rel - 5) / self.line_height) + self.scroll_offset
+            
+            if 0 <= line_index < len(self.lines):
+                self.set_selected_index(line_index)
+                return True
         
         return False
     
@@ -1,12 +1,12 @@
 """Topographical contour map widget for DEM/GeoTIFF data"""
 import pygame
 import numpy as np
-import matplotlib
-matplotlib.use('Agg')  # Use non-interactive backend
-import matplotlib.pyplot as plt
+from contourpy import contour_generator, LineType
 from ui.widgets.sprite import LcarsWidget
+from ui.widgets._topo_kernels import minmax, quantize, segment_length_stats
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 
 class LcarsTopoMap(LcarsWidget):
@@ -25,9 +25,13 @@ class LcarsTopoMap(LcarsWidget):
     DEFAULT_CONTOUR_LEVELS = 10  # Reduced from 15 for better performance
     DEFAULT_OUTLIER_THRESHOLD = 3.0
     SAMPLE_SIZE = 500
-    MOVEMENT_THRESHOLD = 15  # Increased from 5 - regenerate less often
     ZOOM_THRESHOLD = 0.02   # Zoom change before regenerating
     
+    # Large DEMs are downsampled on load to keep panning responsive
+    MAX_DEM_SIZE = 4096         # Reduced from 8000 - still plenty of detail
+    MAX_DEM_PIXELS = 10000000   # Downsample above 10 megapixels...
+    TARGET_DEM_PIXELS = 8000000 # ...to about 8 megapixels, plenty
+    
     def __init__(self, pos, size=(640, 480), dem_file_path=None):
         """
         Initialize topographical map display
@@ -39,13 +43,15 @@ class LcarsTopoMap(LcarsWidget):
         """
         self.display_width = size[0]
         self.display_height = size[1]
-        self.image = pygame.Surface(size)
+        self.image = pygame.Surface(size).convert()
         self.image.fill((0, 0, 0))  # Black background (LCARS style)
         
         LcarsWidget.__init__(self, None, pos, size)
         
         # DEM data
         self.dem_data = None
+        self._nodata_fill = None  # Set for read-only (memory-mapped) DEMs
+        self._pyramid = []  # dem_data followed by 2x, 4x, ... levels, built on first use
         self.dem_width = 0
         self.dem_height = 0
         self.dem_file_path = dem_file_path
@@ -64,14 +70,81 @@ class LcarsTopoMap(LcarsWidget):
         
         # Cached rendering
         self.cached_surf = None
+        self._scaled_surf = None
+        self._scaled_key = None
+        # Two patch buffers alternate: one backs cached_surf on screen while
+        # the next regeneration draws into the other
+        self._patch_bufs = [None, None]
+        self._frame_key = None  # State the current self.image was drawn from
         self.cached_offset_x = 0
         self.cached_offset_y = 0
+        self._cached_world_rect = None  # (x_start, y_start, x_end, y_end) in DEM pixels
         self.last_cam_x = 0
         self.last_cam_y = 0
         self.last_zoom = 1.0
         self.last_threshold = self.DEFAULT_OUTLIER_THRESHOLD
         self.stats = {}
         
+        # Elevation colour ramp as a 256-entry lookup table: black to dark
+        # blue over the lower half, blue to light blue/white over the upper
+        t = np.arange(256) / 255.0
+        lower = t < 0.5
+        intensity_lower = t[lower] * 2
+        intensity_upper = (t[~lower] - 0.5) * 2
+        self._elev_lut = np.zeros((256, 3), dtype=np.uint8)
+        self._elev_lut[lower, 2] = (intensity_lower * 128).astype(np.uint8)
+        self._elev_lut[~lower, 0] = (intensity_upper * 200).astype(np.uint8)
+        self._elev_lut[~lower, 1] = (intensity_upper * 220).astype(np.uint8)
+        self._elev_lut[~lower, 2] = (128 + intensity_upper * 127).astype(np.uint8)
+        
+        # Fonts for the overlays, loaded once
+        self._overlay_font = pygame.font.Font("assets/swiss911.ttf", 18)
+        self._grid_font = pygame.font.Font("assets/swiss911.ttf", 16)
+        
+        # The no-data message never changes, so it is rendered once
+        nodata_font_big = pygame.font.Font("assets/swiss911.ttf", 24)
+        nodata_font_small = pygame.font.Font("assets/swiss911.ttf", 16)
+        self._nodata_text = nodata_font_big.render("NO DEM DATA LOADED", True, (255, 153, 0))  # LCARS Orange
+        self._nodata_rect = self._nodata_text.get_rect(
+            center=(self.display_width // 2, self.display_height // 2))
+        self._nodata_hint = nodata_font_small.render("Place GeoTIFF file in assets/", True, (153, 153, 255))  # LCARS Blue
+        self._nodata_hint_rect = self._nodata_hint.get_rect(
+            center=(self.display_width // 2, self.display_height // 2 + 40))
+        
+        # Semi-transparent black backgrounds for labels, keyed by alpha and
+        # shared by every label; each blits as much of one as it needs
+        self._shades = {}
+        for alpha in (180, 200):
+            shade = pygame.Surface(size).convert()
+            shade.fill((0, 0, 0))
+            shade.set_alpha(alpha)
+            self._shades[alpha] = shade
+        
+        # Rendered info overlay lines keyed by (text, colour)
+        self._overlay_cache = {}
+        
+        # Downsampled elevation colours and the contour layer, both in the
+        # display format and reused while their size matches
+        self._elevation_surf = None
+        self._contour_surf = None
+        
+        # Contour paths traced for the current patch, reused while the patch
+        # bounds and stride stay the same
+        self._cgen_key = None
+        # Traced paths are stored concatenated: path i is
+        # _cgen_verts[_cgen_offsets[i]:_cgen_offsets[i + 1]]
+        self._cgen_verts = None
+        self._cgen_offsets = None
+        self._cgen_pixels = None  # _cgen_verts truncated to int32 pixels
+        
+        # Contours are regenerated on a worker thread while update() keeps
+        # drawing the previous surface. _regen_view is the (cam_x, cam_y,
+        # zoom, threshold) the in-flight job was started with
+        self._regen_executor = ThreadPoolExecutor(max_workers=1)
+        self._regen_future = None
+        self._regen_view = None
+        self._dem_serial = 0  # Bumped per load so stale jobs can't leak in
+        
         # GPS integration (future)
         self.gps_lat = None
         self.gps_lon = None
@@ -154,8 +227,6 @@ class LcarsTopoMap(LcarsWidget):
             bool: True if loaded successfully, False otherwise
         """
         try:
-            from PIL import Image
-            
             print("Loading DEM file: {}".format(file_path))
             
             # Parse geographic bounds from filename
@@ -166,48 +237,54 @@ class LcarsTopoMap(LcarsWidget):
                 print("Warning: Could not determine geographic bounds")
                 print("  Lat/lon labels will not be displayed")
             
-            # Increase PIL's decompression bomb limit for large DEMs
-            # Default is 178,956,970 pixels, we'll increase to 500M for USGS DEMs
-            Image.MAX_IMAGE_PIXELS = 500000000
-            
-            # Open with PIL
-            img = Image.open(file_path)
-            
-            # Get image dimensions before loading
-            width, height = img.size
-            print("DEM dimensions: {}x{} pixels ({:.1f} megapixels)".format(
-                width, height, (width * height) / 1000000))
-            
-            # Check if image is too large - if so, downsample
-            # Be more aggressive with downsampling to improve load time
-            max_size = 4096  # Reduced from 8000 - still plenty of detail
-            if width > max_size or height > max_size:
-                print("DEM is large - downsampling for better performance...")
-                scale = min(max_size / width, max_size / height)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
+            # Memory-map the file when tifffile can, so only the parts a
+            # patch touches are ever read; otherwise decode it with PIL
+            self.dem_data = self._memmap_dem(file_path)
+            if self.dem_data is None:
+                from PIL import Image
                 
-                # Downsample the image
-                print("  Downsampling to {}x{} ({:.0f}% of original size)...".format(
-                    new_width, new_height, scale * 100))
-                img = img.resize((new_width, new_height), Image.BILINEAR)
-                print("  Downsampling complete!")
-            elif width * height > 10000000:  # > 10 megapixels
-                # Even if dimensions are OK, downsample if total pixels is very high
-                print("DEM has many pixels - downsampling for better performance...")
-                target_pixels = 8000000  # 8 megapixels is plenty
-                scale = np.sqrt(target_pixels / (width * height))
-                new_width = int(width * scale)
-                new_height = int(height * scale)
+                # Increase PIL's decompression bomb limit for large DEMs
+                # Default is 178,956,970 pixels, we'll increase to 500M for USGS DEMs
+                Image.MAX_IMAGE_PIXELS = 500000000
                 
-                print("  Downsampling to {}x{} ({:.0f}% of original size)...".format(
-                    new_width, new_height, scale * 100))
-                img = img.resize((new_width, new_height), Image.BILINEAR)
-                print("  Downsampling complete!")
-            
-            # Convert to numpy array
-            # GeoTIFF elevation data is typically stored as 16-bit or 32-bit integers
-            self.dem_data = np.array(img)
+                # Open with PIL
+                img = Image.open(file_path)
+                
+                # Get image dimensions before loading
+                width, height = img.size
+                print("DEM dimensions: {}x{} pixels ({:.1f} megapixels)".format(
+                    width, height, (width * height) / 1000000))
+                
+                # Check if image is too large - if so, downsample
+                # Be more aggressive with downsampling to improve load time
+                max_size = self.MAX_DEM_SIZE
+                if width > max_size or height > max_size:
+                    print("DEM is large - downsampling for better performance...")
+                    scale = min(max_size / width, max_size / height)
+                    new_width = int(width * scale)
+                    new_height = int(height * scale)
+                    
+                    # Downsample the image
+                    print("  Downsampling to {}x{} ({:.0f}% of original size)...".format(
+                        new_width, new_height, scale * 100))
+                    img = img.resize((new_width, new_height), Image.BILINEAR)
+                    print("  Downsampling complete!")
+                elif width * height > self.MAX_DEM_PIXELS:
+                    # Even if dimensions are OK, downsample if total pixels is very high
+                    print("DEM has many pixels - downsampling for better performance...")
+                    target_pixels = self.TARGET_DEM_PIXELS
+                    scale = np.sqrt(target_pixels / (width * height))
+                    new_width = int(width * scale)
+                    new_height = int(height * scale)
+                    
+                    print("  Downsampling to {}x{} ({:.0f}% of original size)...".format(
+                        new_width, new_height, scale * 100))
+                    img = img.resize((new_width, new_height), Image.BILINEAR)
+                    print("  Downsampling complete!")
+                
+                # Convert to numpy array
+                # GeoTIFF elevation data is typically stored as 16-bit or 32-bit integers
+                self.dem_data = np.array(img)
             
             # Handle different data types
             if self.dem_data.dtype == np.uint16:
@@ -236,17 +313,42 @@ class LcarsTopoMap(LcarsWidget):
             else:
                 raise ValueError("Unexpected array shape: {}".format(self.dem_data.shape))
             
+            # float32 is plenty for elevations and halves the bytes every
+            # later pass reads. A memory-mapped file is left as it is, since
+            # converting it would read the whole DEM into memory
+            if self.dem_data.dtype == np.float64 and not isinstance(self.dem_data, np.memmap):
+                self.dem_data = self.dem_data.astype(np.float32)
+            
             # Handle nodata values (often -9999 or 0 in DEMs)
             # Replace with the median to avoid artifacts
-            if self.dem_data.dtype in [np.int16, np.int32, np.float32, np.float64]:
-                # Look for obvious nodata values
-                nodata_mask = (self.dem_data < -1000) | (self.dem_data > 10000)
-                if np.any(nodata_mask):
-                    median_val = np.median(self.dem_data[~nodata_mask])
-                    self.dem_data[nodata_mask] = median_val
-                    print("Replaced {} nodata values with median".format(np.sum(nodata_mask)))
+            self._nodata_fill = None
+            signed = self.dem_data.dtype in [np.int16, np.int32, np.float32, np.float64]
+            if signed and isinstance(self.dem_data, np.memmap):
+                # The mapping is read-only: pick the fill value from a sample
+                # and replace nodata as patches are read (see _fill_nodata)
+                sample = self.dem_data[::16, ::16]
+                sample = sample[(sample >= -1000) & (sample <= 10000)]
+                if sample.size:
+                    self._nodata_fill = np.median(sample)
+            elif signed:
+                # Look for obvious nodata values, building the mask in place
+                # rather than through two temporary boolean arrays
+                nodata_mask = np.less(self.dem_data, -1000)
+                nodata_mask |= np.greater(self.dem_data, 10000, out=np.empty_like(nodata_mask))
+                nodata_count = np.count_nonzero(nodata_mask)
+                if nodata_count:
+                    # A 1-in-256 sample is plenty to pick a fill value and
+                    # avoids copying every valid pixel just for the median
+                    sample = self.dem_data[::16, ::16]
+                    sample = sample[~nodata_mask[::16, ::16]]
+                    if sample.size == 0:
+                        sample = self.dem_data[~nodata_mask]
+                    median_val = np.median(sample)
+                    np.copyto(self.dem_data, median_val, casting="unsafe", where=nodata_mask)
+                    print("Replaced {} nodata values with median".format(nodata_count))
             
             self.dem_file_path = file_path
+            self._pyramid = [self.dem_data]
             
             # Center the view on Powhatan, Virginia (37.5277°N, 77.4710°W)
             # Convert lat/lon to pixel coordinates
@@ -269,13 +371,25 @@ class LcarsTopoMap(LcarsWidget):
             
             # Invalidate cache
             self.cached_surf = None
+            self._cgen_key = None
+            self._dem_serial += 1
+            # Any queued or running job is for the old DEM. A job that has
+            # already started can't be cancelled, but it stops before tracing
+            # once it sees the serial has moved on
+            if self._regen_future is not None:
+                self._regen_future.cancel()
+                self._regen_future = None
             
             print("Successfully loaded DEM: {}x{} elevation data".format(
                 self.dem_width, self.dem_height))
-            print("Elevation range: {:.1f} to {:.1f}".format(
-                np.min(self.dem_data), np.max(self.dem_data)))
-            print("Memory usage: ~{:.1f} MB".format(
-                self.dem_data.nbytes / 1024 / 1024))
+            if isinstance(self.dem_data, np.memmap):
+                print("Memory-mapped view: ~{:.1f} MB".format(
+                    self.dem_data.nbytes / 1024 / 1024))
+            else:
+                print("Elevation range: {:.1f} to {:.1f}".format(
+                    np.min(self.dem_data), np.max(self.dem_data)))
+                print("Memory usage: ~{:.1f} MB".format(
+                    self.dem_data.nbytes / 1024 / 1024))
             print("Starting view: centered at ({:.0f}, {:.0f}), zoom {:.1f}x".format(
                 self.dem_width / 2, self.dem_height / 2, self.zoom))
             
@@ -287,6 +401,102 @@ class LcarsTopoMap(LcarsWidget):
             traceback.print_exc()
             return False
     
+    def _extend_pyramid(self, pyramid, level, nodata_fill):
+        """
+        Build the 2x box-filtered DEM levels up to the given one
+        
+        Levels are built on first use, so a memory-mapped DEM is only read
+        whole once a zoomed-out view needs one. They are float32 and reduced
+        in bands of rows, so the DEM is streamed through instead of being
+        copied whole. Levels stop once the short side is 512 pixels or less.
+        
+        Args:
+            pyramid: Levels built so far, starting with the DEM itself;
+                     extended in place
+            level: Deepest level wanted
+            nodata_fill: Replacement for nodata in the DEM, or None
+        """
+        band = 1024  # rows per pass, must be even
+        while len(pyramid) <= level and min(pyramid[-1].shape) > 512:
+            prev = pyramid[-1]
+            h = prev.shape[0] // 2 * 2
+            w = prev.shape[1] // 2 * 2
+            half = np.empty((h // 2, w // 2), dtype=np.float32)
+            for y in range(0, h, band):
+                rows = prev[y:min(y + band, h), :w]
+                if len(pyramid) == 1:
+                    rows = self._fill_nodata(rows, nodata_fill)
+                rows = rows.astype(np.float32)
+                out = half[y // 2:(y + rows.shape[0]) // 2]
+                np.add(rows[0::2, 0::2], rows[1::2, 0::2], out=out)
+                out += rows[0::2, 1::2]
+                out += rows[1::2, 1::2]
+                out *= 0.25
+            pyramid.append(half)
+    
+    def _memmap_dem(self, file_path):
+        """
+        Memory-map an uncompressed GeoTIFF with tifffile
+        
+        Args:
+            file_path: Path to GeoTIFF file
+            
+        Returns:
+            np.memmap: Read-only elevation array, or None if tifffile is not
+                       installed or can't map this file (e.g. compressed)
+        """
+        try:
+            import tifffile
+        except ImportError:
+            return None
+        
+        try:
+            data = tifffile.memmap(file_path, mode='r')
+        except Exception as e:
+            print("Could not memory-map DEM ({}), decoding instead".format(e))
+            return None
+        
+        height, width = data.shape[:2]
+        print("DEM dimensions: {}x{} pixels ({:.1f} megapixels)".format(
+            width, height, (width * height) / 1000000))
+        
+        # Same size limits as the PIL path, so a zoom level means the same
+        # thing whichever loader ran. A strided view keeps it memory-mapped
+        # (nearest-pixel rather than bilinear, and a whole-number step)
+        step = 1
+        if width > self.MAX_DEM_SIZE or height > self.MAX_DEM_SIZE:
+            step = int(np.ceil(max(width, height) / self.MAX_DEM_SIZE))
+        elif width * height > self.MAX_DEM_PIXELS:
+            step = int(np.ceil(np.sqrt(width * height / self.TARGET_DEM_PIXELS)))
+        if step > 1:
+            data = data[::step, ::step]
+            print("  Downsampling to {}x{} (every {} pixels)".format(
+                data.shape[1], data.shape[0], step))
+        return data
+    
+    def _fill_nodata(self, patch, nodata_fill):
+        """
+        Replace nodata values in a slice of a memory-mapped DEM
+        
+        Args:
+            patch: 2D slice of self.dem_data
+            nodata_fill: Replacement elevation, or None if the DEM needs none
+            
+        Returns:
+            ndarray: The patch itself, or a filled copy if it had nodata
+        """
+        if nodata_fill is None:
+            return patch
+        
+        mask = np.less(patch, -1000)
+        mask |= np.greater(patch, 10000, out=np.empty_like(mask))
+        if not mask.any():
+            return patch
+        
+        patch = np.array(patch)
+        np.copyto(patch, nodata_fill, casting="unsafe", where=mask)
+        return patch
+    
     def _pixel_to_latlon(self, pixel_x, pixel_y):
         """
         Convert pixel coordinates to latitude/longitude
@@ -361,7 +571,8 @@ class LcarsTopoMap(LcarsWidget):
         
         # Return elevation value
         # Note: Y axis is inverted in image coordinates
-        return float(self.dem_data[pixel_y, pixel_x])
+        return float(self._fill_nodata(self.dem_data[pixel_y:pixel_y + 1, pixel_x:pixel_x + 1],
+                                       self._nodata_fill)[0, 0])
     
     def set_gps_position(self, lat, lon):
         """
@@ -538,106 +749,109 @@ class LcarsTopoMap(LcarsWidget):
         self.outlier_threshold = max(1.0, self.outlier_threshold)
         print("Contour sensitivity: {:.2f} std devs".format(self.outlier_threshold))
     
-    def _calculate_segment_length(self, p1, p2):
-        """Calculate Euclidean distance between two points"""
-        dx = p2[0] - p1[0]
-        dy = p2[1] - p1[1]
-        return np.sqrt(dx*dx + dy*dy)
-    
-    def _analyze_contour_segments_fast(self, all_paths):
+    def _analyze_contour_segments_fast(self, verts, offsets):
         """
         Fast sampling-based analysis of contour segments
         
         Samples contour segments to determine adaptive filtering threshold
-        """
-        all_lengths = []
-        
-        for path in all_paths:
-            points = path.vertices
-            if len(points) > 1:
-                for i in range(1, len(points)):
-                    length = self._calculate_segment_length(points[i-1], points[i])
-                    all_lengths.append(length)
-                    
-                    if len(all_lengths) >= self.SAMPLE_SIZE:
-                        break
-            if len(all_lengths) >= self.SAMPLE_SIZE:
-                break
         
-        if len(all_lengths) == 0:
+        Args:
+            verts: (M, 2) vertices of all contour paths, concatenated
+            offsets: (K + 1,) index of each path's first vertex, then M
+        """
+        # Segments held by paths 0..i, i.e. vertices minus one per path
+        n_paths = len(offsets) - 1
+        segments = offsets[1:] - np.arange(1, n_paths + 1)
+        if n_paths == 0 or segments[-1] == 0:
             return 100
         
-        lengths_array = np.array(all_lengths)
-        mean_length = np.mean(lengths_array)
-        std_length = np.std(lengths_array)
+        # Only the paths needed to reach the sample are measured
+        last = min(np.searchsorted(segments, self.SAMPLE_SIZE), n_paths - 1)
+        mean_length, std_length = segment_length_stats(
+            verts[:offsets[last + 1]], offsets[:last + 1], self.SAMPLE_SIZE)
         threshold = mean_length + (self.outlier_threshold * std_length)
         
         return threshold
     
-    def _filter_contour_path_fast(self, points, max_length):
+    def _filter_contour_path_fast(self, verts, offsets, max_length, draw_points=None):
         """
         Fast filtering using numpy operations
         
-        Breaks contour paths at discontinuities (long segments)
-        """
-        if len(points) < 2:
-            return []
-        
-        points_array = np.array(points)
-        diffs = np.diff(points_array, axis=0)
-        lengths = np.sqrt(diffs[:, 0]**2 + diffs[:, 1]**2)
-        breaks = np.where(lengths > max_length)[0]
-        
-        if len(breaks) == 0:
-            return [points]
-        
-        segments = []
-        start_idx = 0
+        Breaks contour paths at discontinuities (long segments), for all
+        paths in one pass over the concatenated vertices
         
-        for break_idx in breaks:
-            if break_idx > start_idx:
-                segment = points[start_idx:break_idx+1]
-                if len(segment) > 1:
-                    segments.append(segment)
-            start_idx = break_idx + 1
-        
-        if start_idx < len(points):
-            segment = points[start_idx:]
-            if len(segment) > 1:
-                segments.append(segment)
-        
-        return segments
+        Args:
+            verts: (M, 2) vertices of all contour paths, concatenated
+            offsets: (K + 1,) index of each path's first vertex, then M
+            max_length: Segments longer than this break the path
+            draw_points: (M, 2) array split in place of verts, e.g. the
+                         same vertices in whole pixels (optional)
+            
+        Returns:
+            tuple: (segments, kept) - list of (N, 2) vertex arrays with at
+                   least two points each, and how many paths kept any
+        """
+        if draw_points is None:
+            draw_points = verts
+        if len(verts) < 2:
+            return [], 0
+        
+        diffs = np.diff(verts, axis=0)
+        cut = np.hypot(diffs[:, 0], diffs[:, 1]) > max_length
+        # The step from one path's last vertex to the next path's first
+        # is not a segment, so always cut there too
+        cut[offsets[1:-1] - 1] = True
+        breaks = np.nonzero(cut)[0] + 1
+        
+        # A break at i drops the segment between points i-1 and i; the
+        # pieces are views into draw_points, not copies
+        starts = np.concatenate(([0], breaks))
+        drawn = np.diff(np.concatenate((starts, [len(verts)]))) > 1
+        kept = len(np.unique(np.searchsorted(offsets, starts[drawn], side='right')))
+        segments = [segment for segment, keep in zip(np.split(draw_points, breaks), drawn)
+                    if keep]
+        return segments, kept
     
-    def _get_visible_contours(self):
+    def _get_visible_contours(self, cam_x, cam_y, zoom, pyramid, dem_serial,
+                              dem_width, dem_height, nodata_fill):
         """
-        Generate contours for the currently visible area
+        Generate contours for the given view
         
         OPTIMIZED: Uses adaptive downsampling based on zoom level.
         At low zoom (wide view), we downsample the DEM data significantly
         since we don't need full resolution for the overview.
         
+        Runs on the regeneration worker thread, so the view and the DEM it
+        was submitted for are passed in rather than read from the widget,
+        which may have panned or loaded another DEM in the meantime.
+        
+        Args:
+            cam_x: Camera x offset in DEM pixels
+            cam_y: Camera y offset in DEM pixels
+            zoom: Zoom level
+            pyramid: self._pyramid of the DEM to trace
+            dem_serial: self._dem_serial of that DEM
+            dem_width: Its width in pixels
+            dem_height: Its height in pixels
+            nodata_fill: Its self._nodata_fill
+            
         Returns:
             tuple: (surface, offset_x, offset_y, stats_dict)
         """
-        if self.dem_data is None:
+        if not pyramid:
             return None, 0, 0, {}
         
         sw, sh = self.display_width, self.display_height
-        buffer = int(max(sw, sh) / self.zoom * 0.3)
+        buffer = int(max(sw, sh) / zoom * 0.3)
         
         # Calculate visible bounds with buffer
-        x_start = max(0, int(-self.cam_x) - buffer)
-        y_start = max(0, int(-self.cam_y) - buffer)
-        x_end = min(self.dem_width, int(-self.cam_x + sw / self.zoom) + buffer)
-        y_end = min(self.dem_height, int(-self.cam_y + sh / self.zoom) + buffer)
-        
-        visible_x_start = max(0, int(-self.cam_x))
-        visible_y_start = max(0, int(-self.cam_y))
+        x_start = max(0, int(-cam_x) - buffer)
+        y_start = max(0, int(-cam_y) - buffer)
+        x_end = min(dem_width, int(-cam_x + sw / zoom) + buffer)
+        y_end = min(dem_height, int(-cam_y + sh / zoom) + buffer)
         
-        # Extract patch of DEM data
-        patch = self.dem_data[y_start:y_end, x_start:x_end]
-        if patch.size == 0:
-            return None, 0, 0, {}
+        visible_x_start = max(0, int(-cam_x))
+        visible_y_start = max(0, int(-cam_y))
         
         # OPTIMIZATION: Adaptive downsampling based on zoom level
         # At low zoom, we don't need full resolution
@@ -645,36 +859,72 @@ class LcarsTopoMap(LcarsWidget):
         # REDUCED AGGRESSIVENESS per user feedback
         downsample_factor = 1
         
-        if self.zoom < 0.3:
+        if zoom < 0.3:
             # Very very zoomed out - moderate downsampling
             downsample_factor = 4
-        elif self.zoom < 0.75:
+        elif zoom < 0.75:
             # Very zoomed out - light downsampling
             downsample_factor = 3
-        elif self.zoom < 1.5:
+        elif zoom < 1.5:
             # Zoomed out - minimal downsampling
             downsample_factor = 2
         # else: zoom >= 1.5 - use full resolution (downsample_factor = 1)
         
-        # Apply downsampling if needed
+        # Never trace more cells than the display can show: a patch several
+        # times larger than the widget is strided down to about its size
+        display_stride = min((y_end - y_start) // self.display_height,
+                             (x_end - x_start) // self.display_width)
+        downsample_factor = max(downsample_factor, display_stride)
+        
+        # Extract the patch from the deepest pyramid level the downsampling
+        # allows, so zoomed-out views neither read nor trace the full DEM
+        level = downsample_factor.bit_length() - 1
+        self._extend_pyramid(pyramid, level, nodata_fill)
+        level = min(len(pyramid) - 1, level)
+        scale = 1 << level
+        patch = pyramid[level][y_start // scale:-(-y_end // scale),
+                                     x_start // scale:-(-x_end // scale)]
+        if patch.size == 0:
+            return None, 0, 0, {}
+        if level == 0:
+            patch = self._fill_nodata(patch, nodata_fill)
+        
+        # Apply whatever downsampling the pyramid level didn't cover
+        stride = max(1, downsample_factor // scale)
+        downsample_factor = scale * stride
         if downsample_factor > 1:
             # Downsample using numpy slicing (very fast!)
-            patch_display = patch[::downsample_factor, ::downsample_factor]
-            print("Downsampled DEM by {}x for contours (zoom {:.1f}x): {} -> {} pixels".format(
-                downsample_factor, self.zoom,
-                patch.shape, patch_display.shape))
+            patch_display = patch[::stride, ::stride]
+            print("Downsampled DEM by {}x for contours (zoom {:.1f}x, level {}): {} -> {} pixels".format(
+                downsample_factor, zoom, level,
+                (y_end - y_start, x_end - x_start), patch_display.shape))
         else:
             patch_display = patch
         
         # Create surface for rendering
         # Surface size matches the ORIGINAL patch size (we'll scale up the downsampled contours)
-        surf = pygame.Surface((x_end - x_start, y_end - y_start), pygame.SRCALPHA)
-        surf.fill((0, 0, 0, 255))  # Start with black background
+        # It is fully opaque, so it is kept in the display format without
+        # per-pixel alpha. It is a subsurface of whichever patch buffer is
+        # not holding the cached_surf currently on screen
+        width, height = x_end - x_start, y_end - y_start
+        on_screen = self.cached_surf.get_parent() if self.cached_surf else None
+        slot = 1 if on_screen is not None and on_screen is self._patch_bufs[0] else 0
+        buf = self._patch_bufs[slot]
+        if buf is None or buf.get_width() < width or buf.get_height() < height:
+            # Grow only; smaller patches reuse the top-left corner
+            if buf is not None:
+                width_alloc = max(width, buf.get_width())
+                height_alloc = max(height, buf.get_height())
+            else:
+                width_alloc, height_alloc = width, height
+            buf = pygame.Surface((width_alloc, height_alloc)).convert()
+            self._patch_bufs[slot] = buf
+        surf = buf.subsurface((0, 0, width, height))
+        surf.fill((0, 0, 0))  # Start with black background
         
         # STEP 1: Draw elevation-based color gradient FIRST (underneath contours)
         # Normalize elevation data to 0-1 range for this patch
-        patch_min = np.min(patch)
-        patch_max = np.max(patch)
+        patch_min, patch_max = minmax(patch)
         patch_range = patch_max - patch_min
         
         if patch_range > 0:
@@ -682,42 +932,31 @@ class LcarsTopoMap(LcarsWidget):
             # We don't need full resolution for the color gradient
             # Downsample to roughly screen resolution
             target_size = 200  # pixels - good balance of quality and speed
-            height, width = patch.shape
             
-            if height > target_size or width > target_size:
+            if patch.shape[0] > target_size or patch.shape[1] > target_size:
                 # Calculate downsample factor
-                downsample_color = max(height // target_size, width // target_size, 1)
+                downsample_color = max(patch.shape[0] // target_size,
+                                       patch.shape[1] // target_size, 1)
                 # Downsample using slicing (very fast)
                 patch_small = patch[::downsample_color, ::downsample_color]
             else:
                 patch_small = patch
             
-            # Normalize to 0-1 (VECTORIZED - very fast!)
-            normalized = (patch_small - patch_min) / patch_range
-            
-            # Create color gradient using VECTORIZED operations (100x faster than loops!)
-            height_small, width_small = normalized.shape
-            
-            # Pre-allocate RGB array
-            color_array = np.zeros((height_small, width_small, 3), dtype=np.uint8)
-            
-            # Lower half: black to dark blue (VECTORIZED)
-            lower_mask = normalized < 0.5
-            intensity_lower = normalized[lower_mask] * 2
-            color_array[lower_mask, 2] = (intensity_lower * 128).astype(np.uint8)  # Blue channel
-            
-            # Upper half: blue to light blue/white (VECTORIZED)
-            upper_mask = normalized >= 0.5
-            intensity_upper = (normalized[upper_mask] - 0.5) * 2
-            color_array[upper_mask, 0] = (intensity_upper * 200).astype(np.uint8)  # Red channel
-            color_array[upper_mask, 1] = (intensity_upper * 220).astype(np.uint8)  # Green channel
-            color_array[upper_mask, 2] = (128 + intensity_upper * 127).astype(np.uint8)  # Blue channel
+            # Quantize elevation to 0-255 and colour it with one table lookup.
+            # Working on the transposed view gives the (x, y, rgb) layout
+            # pygame.surfarray expects without a transpose copy
+            idx = quantize(patch_small.T, patch_min, patch_max)
+            color_array = self._elev_lut[idx]
             
-            # Convert to pygame surface (fast!)
-            elevation_surface = pygame.surfarray.make_surface(np.transpose(color_array, (1, 0, 2)))
+            # Copy into a surface kept across regenerations of the same size
+            if (self._elevation_surf is None or
+                    self._elevation_surf.get_size() != color_array.shape[:2]):
+                self._elevation_surf = pygame.Surface(color_array.shape[:2]).convert()
+            pygame.surfarray.blit_array(self._elevation_surf, color_array)
+            elevation_surface = self._elevation_surf
             
             # Scale up to full size if we downsampled
-            if height > target_size or width > target_size:
+            if elevation_surface.get_size() != (width, height):
                 elevation_surface = pygame.transform.smoothscale(elevation_surface, (width, height))
             
             # Blit to main surface
@@ -725,57 +964,83 @@ class LcarsTopoMap(LcarsWidget):
         
         # STEP 2: Generate and draw contours ON TOP of elevation colors
         # Use the DOWNSAMPLED patch for contour generation (much faster!)
+        # contourpy's serial tracer gives the vertex arrays directly, without
+        # building a matplotlib figure just to read its paths back
+        if dem_serial != self._dem_serial:
+            # Another DEM was loaded while this job ran - its result would be
+            # thrown away, so don't hold up the new DEM's first render
+            return None, 0, 0, {}
         try:
-            fig, ax = plt.subplots()
-            contours = ax.contour(patch_display, levels=self.DEFAULT_CONTOUR_LEVELS)
-            plt.close(fig)
-            
-            # Get contour paths - compatible with older matplotlib versions
-            try:
-                all_paths = contours.get_paths()
-            except AttributeError:
-                # Older matplotlib - extract paths from collections
+            cgen_key = (dem_serial, x_start, y_start, x_end, y_end, downsample_factor)
+            if cgen_key != self._cgen_key:
                 all_paths = []
-                for collection in contours.collections:
-                    for path in collection.get_paths():
-                        all_paths.append(path)
+                if patch_range > 0:
+                    cgen = contour_generator(z=patch_display, name="serial",
+                                             line_type=LineType.Separate)
+                    # Evenly spaced levels strictly inside the elevation range
+                    levels = np.linspace(patch_min, patch_max,
+                                         self.DEFAULT_CONTOUR_LEVELS + 2)[1:-1]
+                    for level in levels:
+                        all_paths.extend(cgen.lines(level))
+                # One flat vertex buffer plus path offsets, so analysis and
+                # filtering run over all paths at once
+                if all_paths:
+                    verts = np.concatenate(all_paths)
+                else:
+                    verts = np.empty((0, 2))
+                offsets = np.cumsum([0] + [len(points) for points in all_paths])
+                # Whole pixels for drawing (pygame truncates float points the
+                # same way), converted once per trace rather than per filter
+                pixels = verts.astype(np.int32)
+                self._cgen_key = cgen_key
+                self._cgen_verts = verts
+                self._cgen_offsets = offsets
+                self._cgen_pixels = pixels
+            else:
+                # Same patch (e.g. only the sensitivity changed): the traced
+                # paths are still valid, only the filtering below reruns
+                verts = self._cgen_verts
+                offsets = self._cgen_offsets
+                pixels = self._cgen_pixels
                         
         except Exception as e:
             print("Error generating contours: {}".format(e))
             return surf, x_start - visible_x_start, y_start - visible_y_start, {}
         
-        adaptive_threshold = self._analyze_contour_segments_fast(all_paths)
+        adaptive_threshold = self._analyze_contour_segments_fast(verts, offsets)
+        segments, kept = self._filter_contour_path_fast(verts, offsets, adaptive_threshold,
+                                                        pixels)
         
-        total_segments = 0
-        filtered_segments = 0
+        total_segments = int(np.count_nonzero(np.diff(offsets) > 1))
+        filtered_segments = total_segments - kept
         
         # Create a separate surface for contours with transparency
         # If we downsampled, create at downsampled size and scale up
         if downsample_factor > 1:
-            contour_surf = pygame.Surface(
-                (patch_display.shape[1], patch_display.shape[0]), 
-                pygame.SRCALPHA
-            )
+            contour_size = (patch_display.shape[1], patch_display.shape[0])
         else:
-            contour_surf = pygame.Surface((x_end - x_start, y_end - y_start), pygame.SRCALPHA)
+            contour_size = (x_end - x_start, y_end - y_start)
+        if self._contour_surf is None or self._contour_surf.get_size() != contour_size:
+            self._contour_surf = pygame.Surface(contour_size, pygame.SRCALPHA).convert_alpha()
+        contour_surf = self._contour_surf
         
         contour_surf.fill((0, 0, 0, 0))  # Fully transparent
         
-        # Draw contours with adaptive filtering
-        for path in all_paths:
-            points = path.vertices
-            if len(points) > 1:
-                total_segments += 1
-                segments = self._filter_contour_path_fast(points, adaptive_threshold)
-                
-                if len(segments) == 0:
-                    filtered_segments += 1
-                
-                for segment in segments:
-                    if len(segment) > 1:
-                        segment_list = segment.tolist() if isinstance(segment, np.ndarray) else segment
-                        # Yellow contour lines (LCARS style) on transparent surface
-                        pygame.draw.lines(contour_surf, (255, 255, 0, 255), False, segment_list, 1)
+        # Draw contours with adaptive filtering. All lines share one colour,
+        # so they are drawn in one pass with the surface locked once instead
+        # of once per draw call
+        contour_surf.lock()
+        try:
+            for segment in segments:
+                segment_list = segment.tolist()
+                # Yellow contour lines (LCARS style) on transparent surface
+                if len(segment_list) == 2:
+                    pygame.draw.line(contour_surf, (255, 255, 0, 255),
+                                     segment_list[0], segment_list[1], 1)
+                else:
+                    pygame.draw.lines(contour_surf, (255, 255, 0, 255), False, segment_list, 1)
+        finally:
+            contour_surf.unlock()
         
         # Scale up contours if we downsampled
         if downsample_factor > 1:
@@ -806,8 +1071,19 @@ class LcarsTopoMap(LcarsWidget):
         if self.cached_surf is None:
             return True
         
-        cam_moved = (abs(self.cam_x - self.last_cam_x) > self.MOVEMENT_THRESHOLD or 
-                    abs(self.cam_y - self.last_cam_y) > self.MOVEMENT_THRESHOLD)
+        # The cached patch extends past the viewport, so pans only need a
+        # new one once the view gets within half that buffer of its edge
+        # (edges that are the DEM's own border never need more)
+        rx0, ry0, rx1, ry1 = self._cached_world_rect
+        margin = max(self.display_width, self.display_height) / self.last_zoom * 0.15
+        x0 = -self.cam_x
+        y0 = -self.cam_y
+        x1 = x0 + self.display_width / self.zoom
+        y1 = y0 + self.display_height / self.zoom
+        cam_moved = ((rx0 > 0 and x0 < rx0 + margin) or
+                     (ry0 > 0 and y0 < ry0 + margin) or
+                     (rx1 < self.dem_width and x1 > rx1 - margin) or
+                     (ry1 < self.dem_height and y1 > ry1 - margin))
         zoom_changed = abs(self.zoom - self.last_zoom) / self.last_zoom > self.ZOOM_THRESHOLD
         threshold_changed = abs(self.outlier_threshold - self.last_threshold) > 0.01
         
@@ -823,7 +1099,7 @@ class LcarsTopoMap(LcarsWidget):
         if self.lat_min is None or self.lon_min is None:
             return  # No geographic bounds available
         
-        font = pygame.font.Font("assets/swiss911.ttf", 16)
+        font = self._grid_font
         
         # LCARS color scheme
         grid_color = (153, 153, 255, 128)  # Semi-transparent light blue
@@ -887,10 +1163,8 @@ class LcarsTopoMap(LcarsWidget):
                     
                     # Background for text
                     bg_rect = text.get_rect(topleft=(5, screen_y - 10))
-                    bg_surf = pygame.Surface((bg_rect.width + 6, bg_rect.height + 4))
-                    bg_surf.set_alpha(180)
-                    bg_surf.fill((0, 0, 0))
-                    surface.blit(bg_surf, (3, screen_y - 12))
+                    surface.blit(self._shades[180], (3, screen_y - 12),
+                                 area=(0, 0, bg_rect.width + 6, bg_rect.height + 4))
                     surface.blit(text, (5, screen_y - 10))
             
             lat += lat_spacing
@@ -917,10 +1191,8 @@ class LcarsTopoMap(LcarsWidget):
                     
                     # Background for text
                     bg_rect = text.get_rect(bottomleft=(screen_x + 5, self.display_height - 5))
-                    bg_surf = pygame.Surface((bg_rect.width + 6, bg_rect.height + 4))
-                    bg_surf.set_alpha(180)
-                    bg_surf.fill((0, 0, 0))
-                    surface.blit(bg_surf, (screen_x + 3, self.display_height - bg_rect.height - 7))
+                    surface.blit(self._shades[180], (screen_x + 3, self.display_height - bg_rect.height - 7),
+                                 area=(0, 0, bg_rect.width + 6, bg_rect.height + 4))
                     surface.blit(text, (screen_x + 5, self.display_height - bg_rect.height - 5))
             
             lon += lon_spacing
@@ -1040,7 +1312,7 @@ class LcarsTopoMap(LcarsWidget):
                         (mid_x, ruler_y + bar_height + 3), 2)
         
         # Label
-        font = pygame.font.Font("assets/swiss911.ttf", 18)
+        font = self._overlay_font
         
         # Format label text
         if unit == "mi":
@@ -1062,10 +1334,7 @@ class LcarsTopoMap(LcarsWidget):
         
         # Background for text
         bg_rect = text_rect.inflate(10, 4)
-        bg_surf = pygame.Surface((bg_rect.width, bg_rect.height))
-        bg_surf.set_alpha(200)
-        bg_surf.fill((0, 0, 0))
-        surface.blit(bg_surf, bg_rect)
+        surface.blit(self._shades[200], bg_rect, area=(0, 0, bg_rect.width, bg_rect.height))
         
         # Draw text
         surface.blit(text_surface, text_rect)
@@ -1110,7 +1379,7 @@ class LcarsTopoMap(LcarsWidget):
         
         # Draw elevation label
         if self.clicked_elevation is not None:
-            font = pygame.font.Font("assets/swiss911.ttf", 18)
+            font = self._overlay_font
             
             # Format elevation text
             elev_text = "Elevation: {:.1f}m ({:.0f}ft)".format(
@@ -1142,10 +1411,8 @@ class LcarsTopoMap(LcarsWidget):
             box_width = max(elev_surface.get_width(), coord_surface.get_width()) + 10
             box_height = elev_surface.get_height() + coord_surface.get_height() + 10
             
-            bg_surf = pygame.Surface((box_width, box_height))
-            bg_surf.set_alpha(200)
-            bg_surf.fill((0, 0, 0))
-            surface.blit(bg_surf, (label_x - 5, label_y - 5))
+            surface.blit(self._shades[200], (label_x - 5, label_y - 5),
+                         area=(0, 0, box_width, box_height))
             
             # Draw border
             pygame.draw.rect(surface, (255, 153, 0),
@@ -1155,16 +1422,26 @@ class LcarsTopoMap(LcarsWidget):
             surface.blit(elev_surface, (label_x, label_y))
             surface.blit(coord_surface, (label_x, label_y + elev_surface.get_height() + 2))
     
-    def _draw_info_overlay(self, surface):
-        """Draw information overlay with map stats"""
+    def _draw_info_overlay(self, surface, needs_regen):
+        """
+        Draw information overlay with map stats
+        
+        Args:
+            surface: Surface to draw on
+            needs_regen: Whether the contours are out of date for this view
+        """
         if not self.stats:
             return
         
-        font = pygame.font.Font("assets/swiss911.ttf", 18)
+        font = self._overlay_font
         
         # Determine cache status
-        cache_status = "CACHED" if not self._needs_regeneration() else "UPDATING"
-        cache_color = (153, 255, 153) if not self._needs_regeneration() else (255, 153, 153)  # Light green / light red
+        if needs_regen:
+            cache_status = "UPDATING"
+            cache_color = (255, 153, 153)  # Light red
+        else:
+            cache_status = "CACHED"
+            cache_color = (153, 255, 153)  # Light green
         
         # LCARS colors: light blue for text
         text_color = (153, 153, 255)  # Light blue (LCARS BLUE)
@@ -1207,66 +1484,101 @@ class LcarsTopoMap(LcarsWidget):
                     lat, abs(lon))
                 info_lines.append((coord_text, text_color))
         
+        # Most frames show the same lines; keep the cache small since the
+        # centre coordinates change with every pan
+        if len(self._overlay_cache) > 32:
+            self._overlay_cache.clear()
+        
         y_pos = 10
         for line_text, color in info_lines:
-            text = font.render(line_text, True, color)
+            text = self._overlay_cache.get((line_text, color))
+            if text is None:
+                text = font.render(line_text, True, color)
+                self._overlay_cache[(line_text, color)] = text
             bg_rect = text.get_rect(topleft=(10, y_pos))
             bg_rect.inflate_ip(10, 4)
             
             # Semi-transparent dark background (LCARS style)
-            bg_surf = pygame.Surface((bg_rect.width, bg_rect.height))
-            bg_surf.set_alpha(180)
-            bg_surf.fill((0, 0, 0))  # Black background
-            surface.blit(bg_surf, bg_rect)
+            surface.blit(self._shades[180], bg_rect, area=(0, 0, bg_rect.width, bg_rect.height))
             
             surface.blit(text, (10, y_pos))
             y_pos += 25
     
     def _draw_no_data_message(self, surface):
         """Draw message when no DEM data is loaded"""
-        font = pygame.font.Font("assets/swiss911.ttf", 24)
-        text = font.render("NO DEM DATA LOADED", True, (255, 153, 0))  # LCARS Orange
-        text_rect = text.get_rect(center=(self.display_width // 2, self.display_height // 2))
-        surface.blit(text, text_rect)
-        
-        font_small = pygame.font.Font("assets/swiss911.ttf", 16)
-        text2 = font_small.render("Place GeoTIFF file in assets/", True, (153, 153, 255))  # LCARS Blue
-        text2_rect = text2.get_rect(center=(self.display_width // 2, self.display_height // 2 + 40))
-        surface.blit(text2, text2_rect)
+        surface.blit(self._nodata_text, self._nodata_rect)
+        surface.blit(self._nodata_hint, self._nodata_hint_rect)
     
     def update(self, screen):
         """Update and render the topographical map"""
         if not self.visible:
             return
         
-        # Clear surface with black background (LCARS style)
-        self.image.fill((0, 0, 0))
-        
         # Check if DEM data is loaded
         if self.dem_data is None:
+            self.image.fill((0, 0, 0))
             self._draw_no_data_message(self.image)
             screen.blit(self.image, self.rect)
             self.dirty = 0
             return
         
-        # Check if we need to regenerate contours
-        if self._needs_regeneration():
-            result = self._get_visible_contours()
+        # Swap in a finished regeneration, then start the next one if the
+        # view has moved on. Until then the previous surface is drawn
+        if self._regen_future is not None and self._regen_future.done():
+            try:
+                result = self._regen_future.result()
+            except Exception as e:
+                print("Error regenerating contours: {}".format(e))
+                result = (None,)
+            self._regen_future = None
             if result[0]:
-                self.cached_surf, self.cached_offset_x, self.cached_offset_y, self.stats = result
-                self.last_cam_x = self.cam_x
-                self.last_cam_y = self.cam_y
-                self.last_zoom = self.zoom
-                self.last_threshold = self.outlier_threshold
+                self.cached_surf, offset_x, offset_y, self.stats = result
+                (self.last_cam_x, self.last_cam_y,
+                 self.last_zoom, self.last_threshold) = self._regen_view
+                # Offsets are relative to the job's view; keep the patch's
+                # DEM position so later pans can just move it
+                rx0 = offset_x + max(0, int(-self.last_cam_x))
+                ry0 = offset_y + max(0, int(-self.last_cam_y))
+                self._cached_world_rect = (rx0, ry0,
+                                           rx0 + self.cached_surf.get_width(),
+                                           ry0 + self.cached_surf.get_height())
+        
+        needs_regen = self._needs_regeneration()
+        if self._regen_future is None and needs_regen:
+            self._regen_view = (self.cam_x, self.cam_y, self.zoom, self.outlier_threshold)
+            self._regen_future = self._regen_executor.submit(
+                self._get_visible_contours, self.cam_x, self.cam_y, self.zoom,
+                self._pyramid, self._dem_serial, self.dem_width, self.dem_height,
+                self._nodata_fill)
+        
+        # Everything the composed image depends on. While it is unchanged the
+        # image from the last frame is still right and is just put back on
+        # screen (the contour surface also stands in for its stats)
+        frame_key = (self.cached_surf, self.cam_x, self.cam_y, self.zoom,
+                     self.outlier_threshold, self.clicked_lat, self.clicked_lon,
+                     self.gps_enabled, self.gps_lat, self.gps_lon, needs_regen)
+        if frame_key == self._frame_key and not self.dirty:
+            screen.blit(self.image, self.rect)
+            return
+        self._frame_key = frame_key
+        
+        # Clear surface with black background (LCARS style)
+        self.image.fill((0, 0, 0))
         
         # Render cached contour surface
         if self.cached_surf:
-            scaled = pygame.transform.smoothscale(
-                self.cached_surf,
-                (int(self.cached_surf.get_width() * self.zoom),
-                 int(self.cached_surf.get_height() * self.zoom))
-            )
-            self.image.blit(scaled, 
+            self.cached_offset_x = self._cached_world_rect[0] - max(0, -self.cam_x)
+            self.cached_offset_y = self._cached_world_rect[1] - max(0, -self.cam_y)
+            # Only rescale when the cached surface or the zoom changed. The
+            # key holds the surface itself so its id can't be reused.
+            scaled_key = (self.cached_surf,
+                          int(self.cached_surf.get_width() * self.zoom),
+                          int(self.cached_surf.get_height() * self.zoom))
+            if scaled_key != self._scaled_key:
+                self._scaled_surf = pygame.transform.smoothscale(
+                    self.cached_surf, scaled_key[1:])
+                self._scaled_key = scaled_key
+            self.image.blit(self._scaled_surf, 
                           (int(self.cached_offset_x * self.zoom),
                            int(self.cached_offset_y * self.zoom)))
         
@@ -1280,7 +1592,7 @@ class LcarsTopoMap(LcarsWidget):
         self._draw_elevation_marker(self.image)
         
         # Draw info overlay
-        self._draw_info_overlay(self.image)
+        self._draw_info_overlay(self.image, needs_regen)
         
         # Draw GPS marker if enabled (future)
         if self.gps_enabled and self.gps_lat and self.gps_lon: